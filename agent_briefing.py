@@ -798,10 +798,11 @@ class AgentBriefing:
 
             # Filter by categories if provided
             if categories:
+                categories_lower = [cat.lower() for cat in categories]
                 filtered = []
                 for article in batch_articles:
                     text = f"{article.title} {article.summary}".lower()
-                    if any(cat.lower() in text for cat in categories):
+                    if any(cat in text for cat in categories_lower):
                         filtered.append(article)
                 if filtered:
                     batch_articles = filtered
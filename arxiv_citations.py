@@ -46,6 +46,9 @@ except ImportError:
 from feeds import Feeds
 from datamodel import Article
 
+# New-style arXiv identifier, without version (2101.12345v2 -> 2101.12345)
+ARXIV_ID_RE = re.compile(r'(\d{4}\.\d{4,5})')
+
 
 class ApiTimeoutError(Exception):
     """Raised when an API operation times out"""
@@ -128,7 +131,7 @@ class ArxivCitationAnalyzer:
             Clean arXiv ID without version, e.g., '2101.12345'
         """
         # Match patterns like 2101.12345v2 or 2101.12345
-        match = re.search(r'(\d{4}\.\d{4,5})', url_or_id)
+        match = ARXIV_ID_RE.search(url_or_id)
         if match:
             return match.group(1)
         return None
@@ -259,12 +262,13 @@ class ArxivCitationAnalyzer:
             List of arXiv IDs cited by this paper
         """
         # 1. Try cache first
-        if self.cache:
-            cached_refs = self.cache.get_citations(arxiv_id, max_age_days=30)
-            if cached_refs is not None:
-                print(f"    Using cached references for {arxiv_id}")
-                return cached_refs
+        cached_refs = self._cached_references(arxiv_id)
+        if cached_refs is not None:
+            return cached_refs
+        return self._fetch_paper_references(arxiv_id)
 
+    def _fetch_paper_references(self, arxiv_id: str) -> List[str]:
+        """get_paper_references without the cache lookup; results are still cached."""
         # 2. Try arXiv HTML (available same-day for most papers)
         html_refs = self._get_references_from_html(arxiv_id)
         if html_refs is not None:
@@ -305,6 +309,15 @@ class ArxivCitationAnalyzer:
         
         return []
     
+    def _cached_references(self, arxiv_id: str) -> Optional[List[str]]:
+        """References from the local cache, or None when not cached."""
+        if self.cache:
+            cached_refs = self.cache.get_citations(arxiv_id, max_age_days=30)
+            if cached_refs is not None:
+                print(f"    Using cached references for {arxiv_id}")
+                return cached_refs
+        return None
+
     def _try_opencitations_references(self, arxiv_id: str) -> List[str]:
         """
         Try to get references from OpenCitations API.
@@ -355,6 +368,9 @@ class ArxivCitationAnalyzer:
             
         print(f"Building citation graph for {len(papers)} papers...")
         
+        # Cross-listed and revised papers appear more than once in a feed;
+        # count each paper's references once
+        seen_ids = set()
         for i, paper in enumerate(papers):
             # Handle both Article and arxiv.Result objects
             if isinstance(paper, Article):
@@ -371,8 +387,9 @@ class ArxivCitationAnalyzer:
                 published = self._format_published_date(paper.published)
                 url = paper.entry_id
                 
-            if not arxiv_id:
+            if not arxiv_id or arxiv_id in seen_ids:
                 continue
+            seen_ids.add(arxiv_id)
             
             # Store paper info
             self.paper_info[arxiv_id] = {
@@ -385,7 +402,10 @@ class ArxivCitationAnalyzer:
             
             # Get references
             print(f"  [{i+1}/{len(papers)}] Fetching references for {arxiv_id}...")
-            references = self.get_paper_references(arxiv_id)
+            references = self._cached_references(arxiv_id)
+            from_cache = references is not None
+            if not from_cache:
+                references = self._fetch_paper_references(arxiv_id)
             
             if references:
                 print(f"    Found {len(references)} arXiv references")
@@ -404,8 +424,9 @@ class ArxivCitationAnalyzer:
                         'summary': ''
                     }
             
-            # Respect API rate limits
-            time.sleep(delay)
+            # Respect API rate limits (cache hits made no API call)
+            if not from_cache:
+                time.sleep(delay)
         
         print(f"Citation graph built: {len(self.citation_graph)} unique cited papers")
         return self.citation_graph
@@ -12,73 +12,12 @@ This is designed to work with the Copilot CLI wrapper (see copilot.py).
 
 from __future__ import annotations
 
-import json
 import re
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Dict, List, Optional, Tuple
 
 from datamodel import Article, Group
-from copilot import Copilot
-
-
-def _sanitize_json_blob(blob: str) -> str:
-    """Best-effort cleanup for common LLM JSON breakage.
-
-    The most common failure we see is literal newlines inside quoted strings.
-    JSON forbids that, so we replace them with spaces while inside a string.
-    """
-    out = []
-    in_str = False
-    esc = False
-    for ch in blob:
-        if in_str:
-            if esc:
-                esc = False
-                out.append(ch)
-                continue
-            if ch == "\\":
-                esc = True
-                out.append(ch)
-                continue
-            if ch == '"':
-                in_str = False
-                out.append(ch)
-                continue
-            if ch in "\r\n\t":
-                out.append(" ")
-                continue
-            out.append(ch)
-            continue
-
-        if ch == '"':
-            in_str = True
-        out.append(ch)
-
-    return "".join(out)
-
-
-def _extract_json(text: str) -> Optional[object]:
-    """Extract the first JSON object/array from model output."""
-    # Prefer fenced blocks if present
-    fence = re.search(r"```json\s*(.*?)\s*```", text, flags=re.DOTALL | re.IGNORECASE)
-    if fence:
-        blob = fence.group(1)
-        blob = _sanitize_json_blob(blob)
-        try:
-            return json.loads(blob)
-        except Exception:
-            pass
-
-    # Fall back to first {...} or [...]
-    match = re.search(r"(\{.*\}|\[.*\])", text, flags=re.DOTALL)
-    if not match:
-        return None
-
-    blob = _sanitize_json_blob(match.group(1))
-    try:
-        return json.loads(blob)
-    except Exception:
-        return None
+from copilot import Copilot, extract_json
 
 
 def _normalize_tag(tag: str) -> str:
@@ -147,7 +86,7 @@ Articles:
 """
 
         resp = self.llm.generate(prompt)
-        data = _extract_json(resp)
+        data = extract_json(resp)
         if not isinstance(data, dict) or "tags" not in data or not isinstance(data["tags"], dict):
             # Hard fallback: everything in one bucket
             return {start_index + i: ["misc"] for i in range(len(batch))}
@@ -205,7 +144,7 @@ Tags:
 """
 
         resp = self.llm.generate(prompt)
-        data = _extract_json(resp)
+        data = extract_json(resp)
         if not isinstance(data, dict) or "map" not in data or not isinstance(data["map"], dict):
             return {t: t for t in uniq}
 
@@ -254,7 +193,7 @@ Clusters:
 """
 
         resp = self.llm.generate(prompt)
-        data = _extract_json(resp)
+        data = extract_json(resp)
         if not isinstance(data, dict) or "map" not in data or not isinstance(data["map"], dict):
             return groups
 
@@ -308,21 +247,23 @@ Clusters:
         all_tags = [t for tags in tag_by_index.values() for t in tags]
         mapping = self._merge_tag_vocab(all_tags)
 
+        # Canonical tags per article, resolved once for both grouping passes
+        canon_by_index: Dict[int, List[str]] = {}
+        for i in range(len(articles)):
+            canon_by_index[i] = [
+                mapping.get(tt, tt)
+                for tt in (_normalize_tag(t) for t in tag_by_index.get(i, ["misc"]))
+            ]
+
         # Count canonical tag frequencies across all tags
-        canon_counts: Dict[str, int] = {}
-        for t in all_tags:
-            tt = _normalize_tag(t)
-            ct = mapping.get(tt, tt)
-            canon_counts[ct] = canon_counts.get(ct, 0) + 1
+        canon_counts = Counter(
+            mapping.get(tt, tt) for tt in (_normalize_tag(t) for t in all_tags)
+        )
 
         # 3) Group by canonical tag chosen by global frequency (not per-article specificity)
         buckets: Dict[str, List[Article]] = defaultdict(list)
         for i, article in enumerate(articles):
-            tags = tag_by_index.get(i, ["misc"])
-            canon_tags = []
-            for t in tags:
-                tt = _normalize_tag(t)
-                canon_tags.append(mapping.get(tt, tt))
+            canon_tags = canon_by_index[i]
 
             # Pick the most common canonical tag for this article; tie-break by earliest
             best = None
@@ -339,11 +280,7 @@ Clusters:
         if buckets and (max(len(v) for v in buckets.values()) / len(articles)) > 0.35:
             refined: Dict[str, List[Article]] = defaultdict(list)
             for i, article in enumerate(articles):
-                tags = tag_by_index.get(i, ["misc"])
-                canon_tags = []
-                for t in tags:
-                    tt = _normalize_tag(t)
-                    canon_tags.append(mapping.get(tt, tt))
+                canon_tags = canon_by_index[i]
 
                 canon_primary = canon_tags[0] if canon_tags else "misc"
                 canon_secondary = canon_tags[1] if len(canon_tags) > 1 else ""
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
 import json
 import os
 import random
@@ -7,8 +9,45 @@ import re
 import subprocess
 import time
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union
 
+try:
+    import h2  # noqa: F401 - lets httpx negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Keep-alive pool for Azure OpenAI calls; rankers issue dozens of requests to
+# one host in quick succession, so reusing connections skips TLS setup
+HTTP_POOL_LIMITS = {"max_keepalive_connections": 32, "max_connections": 64}
+
+
+def extract_json(text: str):
+    """Parse a JSON completion, tolerating chatter around the payload.
+
+    Structured output makes the whole response valid JSON; the CLI backend
+    cannot enforce a schema, so fall back to a ```json fenced block, then to
+    the first object or array in it. Literal newlines inside strings, a
+    common model slip, are accepted. Returns None when nothing parses.
+    """
+    text = (text or "").strip()
+    candidates = [text]
+    fence = re.search(r"```json\s*(.*?)\s*```", text, re.DOTALL | re.IGNORECASE)
+    if fence:
+        candidates.append(fence.group(1))
+    for pattern in (r"\{.*\}", r"\[.*\]"):
+        match = re.search(pattern, text, re.DOTALL)
+        if match:
+            candidates.append(match.group())
+    for candidate in candidates:
+        try:
+            return json.loads(candidate, strict=False)
+        except ValueError:
+            continue
+    return None
+
 
 class Copilot:
     """LLM wrapper supporting Azure OpenAI and GitHub Copilot CLI.
@@ -29,6 +68,10 @@ class Copilot:
     def __init__(self, model: str | None = None, cli_command: str = "/usr/local/bin/copilot"):
         self.cli_command = cli_command
         self._azure_client = None
+        self._azure_client_lock = threading.Lock()
+        # Cleared when the deployment rejects response_format; replies are
+        # then free-form and extract_json pulls the payload out of them
+        self._structured_output = True
 
         # Detect Azure OpenAI availability
         self._azure_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
@@ -52,32 +95,119 @@ class Copilot:
             return False
 
     def _get_azure_client(self):
-        """Lazily initialize the Azure OpenAI client."""
-        if self._azure_client is None:
-            from openai import AzureOpenAI
-            self._azure_client = AzureOpenAI(
-                azure_endpoint=self._azure_endpoint,
-                api_key=self._azure_api_key,
-                api_version=self._azure_api_version,
-            )
+        """Lazily initialize the Azure OpenAI client (one pooled client per instance)."""
+        with self._azure_client_lock:
+            if self._azure_client is None:
+                import httpx
+                from openai import AzureOpenAI
+                self._azure_client = AzureOpenAI(
+                    azure_endpoint=self._azure_endpoint,
+                    api_key=self._azure_api_key,
+                    api_version=self._azure_api_version,
+                    http_client=httpx.Client(
+                        http2=HTTP2_AVAILABLE, limits=httpx.Limits(**HTTP_POOL_LIMITS)
+                    ),
+                )
+                atexit.register(self._azure_client.close)
         return self._azure_client
 
-    def _generate_via_azure(self, prompt: str, timeout_s: int = 300) -> str:
+    @staticmethod
+    def _messages(prompt: str, system: str | None = None) -> list:
+        """Chat messages for a prompt, with the stable instructions first.
+
+        Keeping constant instructions in a leading system message gives every
+        call the same prefix, which the service's prompt cache can reuse.
+        """
+        messages = [{"role": "user", "content": prompt}]
+        if system:
+            messages.insert(0, {"role": "system", "content": system})
+        return messages
+
+    @staticmethod
+    def _completion_options(json_schema: dict | None) -> dict:
+        """Extra chat.completions arguments; a schema turns on structured output."""
+        if not json_schema:
+            return {}
+        return {
+            "response_format": {
+                "type": "json_schema",
+                "json_schema": {"name": "response", "schema": json_schema},
+            }
+        }
+
+    def _structured_output_options(self, json_schema: dict | None) -> dict:
+        """_completion_options, unless this deployment has refused structured output."""
+        return self._completion_options(json_schema if self._structured_output else None)
+
+    def _drop_structured_output(self, err: Exception) -> bool:
+        """Turn off structured output if err is a 400 rejecting response_format.
+
+        Such a request fails the same way every time, so it is not worth the
+        retry loop in generate(); the caller retries once without the schema.
+        """
+        if getattr(err, "status_code", None) != 400 or "response_format" not in str(err):
+            return False
+        print(f"Structured output not supported, retrying without response_format: {err}")
+        self._structured_output = False
+        return True
+
+    def _generate_via_azure(self, prompt: str, timeout_s: int = 300, system: str | None = None,
+                            json_schema: dict | None = None) -> str:
         """Generate a completion using Azure OpenAI."""
         client = self._get_azure_client()
-        response = client.chat.completions.create(
-            model=self._azure_deployment,
-            messages=[{"role": "user", "content": prompt}],
-            timeout=timeout_s,
+        options = self._structured_output_options(json_schema)
+        messages = self._messages(prompt, system)
+        try:
+            response = client.chat.completions.create(
+                model=self._azure_deployment, messages=messages, timeout=timeout_s, **options,
+            )
+        except Exception as e:
+            if not (options and self._drop_structured_output(e)):
+                raise
+            response = client.chat.completions.create(
+                model=self._azure_deployment, messages=messages, timeout=timeout_s,
+            )
+        return (response.choices[0].message.content or "").strip()
+
+    def _new_async_azure_client(self):
+        """Create an async Azure OpenAI client (one per event loop)."""
+        import httpx
+        from openai import AsyncAzureOpenAI
+        return AsyncAzureOpenAI(
+            azure_endpoint=self._azure_endpoint,
+            api_key=self._azure_api_key,
+            api_version=self._azure_api_version,
+            http_client=httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE, limits=httpx.Limits(**HTTP_POOL_LIMITS)
+            ),
         )
+
+    async def _generate_via_azure_async(self, client, prompt: str, timeout_s: int = 300,
+                                        system: str | None = None,
+                                        json_schema: dict | None = None) -> str:
+        """Generate a completion using an async Azure OpenAI client."""
+        options = self._structured_output_options(json_schema)
+        messages = self._messages(prompt, system)
+        try:
+            response = await client.chat.completions.create(
+                model=self._azure_deployment, messages=messages, timeout=timeout_s, **options,
+            )
+        except Exception as e:
+            if not (options and self._drop_structured_output(e)):
+                raise
+            response = await client.chat.completions.create(
+                model=self._azure_deployment, messages=messages, timeout=timeout_s,
+            )
         return (response.choices[0].message.content or "").strip()
 
-    def embed(self, texts: Union[str, List[str]], batch_size: int = 20) -> List[List[float]]:
+    def embed(self, texts: Union[str, List[str]], batch_size: int = 20,
+              max_workers: int = 4) -> List[List[float]]:
         """Generate embeddings using Azure OpenAI.
 
         Args:
             texts: Single string or list of strings to embed.
             batch_size: Number of texts per API call.
+            max_workers: Upper bound on API calls in flight at once.
 
         Returns:
             List of embedding vectors (one per input text).
@@ -94,26 +224,70 @@ class Copilot:
         if isinstance(texts, str):
             texts = [texts]
 
-        client = self._get_azure_client()
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        if len(batches) <= 1:
+            results = [self._embed_batch(batch) for batch in batches]
+        else:
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                results = asyncio.run(self._embed_batches_async(batches, max_workers))
+            else:
+                # Called from inside an event loop, where asyncio.run() is not allowed
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+                    results = list(executor.map(self._embed_batch, batches))
+
         all_embeddings: List[List[float]] = []
+        for vectors in results:
+            all_embeddings.extend(vectors)
+        return all_embeddings
 
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i : i + batch_size]
-            response = client.embeddings.create(
-                model=self._azure_embedding_deployment,
-                input=batch,
-            )
-            # Sort by index to preserve order
-            sorted_data = sorted(response.data, key=lambda d: d.index)
-            all_embeddings.extend([d.embedding for d in sorted_data])
+    @staticmethod
+    def _sorted_embeddings(response) -> List[List[float]]:
+        # Sort by index to preserve order
+        return [d.embedding for d in sorted(response.data, key=lambda d: d.index)]
+
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        response = self._get_azure_client().embeddings.create(
+            model=self._azure_embedding_deployment,
+            input=batch,
+        )
+        return self._sorted_embeddings(response)
 
-        return all_embeddings
+    async def _embed_batches_async(self, batches: List[List[str]], max_workers: int) -> List[List[List[float]]]:
+        semaphore = asyncio.Semaphore(max_workers)
+        client = self._new_async_azure_client()
+
+        async def _one(batch):
+            async with semaphore:
+                response = await client.embeddings.create(
+                    model=self._azure_embedding_deployment,
+                    input=batch,
+                )
+                return self._sorted_embeddings(response)
+
+        try:
+            return await asyncio.gather(*(_one(batch) for batch in batches))
+        finally:
+            await client.close()
+
+    @property
+    def embedding_model(self) -> str | None:
+        """Name of the embedding deployment (identifies the vector space)."""
+        return self._azure_embedding_deployment
 
     def has_embeddings(self) -> bool:
         """Check if embedding support is available."""
         return self.use_azure and bool(self._azure_embedding_deployment)
 
-    def _generate_via_cli(self, prompt: str, timeout_s: int = 300) -> str:
+    def _generate_via_cli(self, prompt: str, timeout_s: int = 300, system: str | None = None,
+                          json_schema: dict | None = None) -> str:
+        # The CLI takes a single prompt, so instructions go in front of it
+        if system:
+            prompt = f"{system}\n\n{prompt}"
+        # ...and it cannot enforce a schema, so the schema is spelled out instead
+        if json_schema:
+            prompt += f"\n\nRespond with ONLY JSON matching this schema: {json.dumps(json_schema)}"
         # Avoid any CLI parsing/quoting issues by passing the prompt via @file.
         with tempfile.NamedTemporaryFile("w", delete=True, encoding="utf-8") as f:
             f.write(prompt)
@@ -200,7 +374,7 @@ class Copilot:
         return result
 
 
-    def generate(self, prompt, max_retries=10, base_delay=1.0):
+    def generate(self, prompt, max_retries=10, base_delay=1.0, system=None, json_schema=None):
         last_err = None
         delay = base_delay
         print(f"generating from {prompt[0:200]}")
@@ -208,8 +382,8 @@ class Copilot:
         for attempt in range(max_retries + 1):
             try:
                 if self.use_azure:
-                    return self._generate_via_azure(str(prompt))
-                return self._generate_via_cli(str(prompt))
+                    return self._generate_via_azure(str(prompt), system=system, json_schema=json_schema)
+                return self._generate_via_cli(str(prompt), system=system, json_schema=json_schema)
             except Exception as e:
                 print(f"Attempt {attempt + 1}/{max_retries + 1} failed: {str(e)}")
                 last_err = e
@@ -219,6 +393,73 @@ class Copilot:
 
         raise last_err
 
+    async def generate_async(self, prompt, max_retries=10, base_delay=1.0, client=None, system=None,
+                             json_schema=None):
+        """Async counterpart of generate().
+
+        Args:
+            client: AsyncAzureOpenAI client to use in Azure mode. Without one
+                (and always in CLI mode) the blocking call runs in a worker thread.
+        """
+        last_err = None
+        delay = base_delay
+        print(f"generating from {prompt[0:200]}")
+
+        for attempt in range(max_retries + 1):
+            try:
+                if self.use_azure and client is not None:
+                    return await self._generate_via_azure_async(client, str(prompt), system=system,
+                                                                json_schema=json_schema)
+                if self.use_azure:
+                    return await asyncio.to_thread(self._generate_via_azure, str(prompt), system=system,
+                                                   json_schema=json_schema)
+                return await asyncio.to_thread(self._generate_via_cli, str(prompt), system=system,
+                                               json_schema=json_schema)
+            except Exception as e:
+                print(f"Attempt {attempt + 1}/{max_retries + 1} failed: {str(e)}")
+                last_err = e
+                if attempt < max_retries:
+                    await asyncio.sleep(delay + random.uniform(0, 0.2))
+                    delay = delay * 2
+
+        raise last_err
+
+    async def _generate_batch_async(self, prompts, max_workers, **kwargs):
+        semaphore = asyncio.Semaphore(max_workers)
+        client = self._new_async_azure_client() if self.use_azure else None
+
+        async def _one(prompt):
+            async with semaphore:
+                return await self.generate_async(prompt, client=client, **kwargs)
+
+        try:
+            return await asyncio.gather(*(_one(prompt) for prompt in prompts))
+        finally:
+            if client is not None:
+                await client.close()
+
+    def generate_batch(self, prompts, max_workers=4, **kwargs):
+        """Generate completions for independent prompts concurrently.
+
+        Args:
+            prompts: List of prompt strings.
+            max_workers: Upper bound on in-flight requests.
+            **kwargs: Passed through to generate_async().
+
+        Returns:
+            List of completions, in the same order as prompts.
+        """
+        if len(prompts) <= 1:
+            return [self.generate(prompt, **kwargs) for prompt in prompts]
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self._generate_batch_async(prompts, max_workers, **kwargs))
+
+        # Called from inside an event loop, where asyncio.run() is not allowed
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as executor:
+            return list(executor.map(lambda prompt: self.generate(prompt, **kwargs), prompts))
+
     def rank_items(self, items, prompt_template, top_k=5, batch_size=10):
         item_lines = [line for line in items.split("\n") if line.strip() and line.strip().startswith("[")]
         num_items = len(item_lines)
@@ -1,6 +1,11 @@
 from datetime import datetime
+from functools import cached_property
+import re
 import uuid
 
+# Trailing version on an arXiv identifier (2401.01234v2 -> 2401.01234)
+_ARXIV_VERSION_RE = re.compile(r'v\d+$')
+
 class Article:
     def __init__(self, id=None, title=None, url=None, summary=None, source=None, published_at=None, vector=None, hashed_summary=None, claims=None, keywords=None, cluster=None, age=None):
         self.id = id
@@ -24,6 +29,19 @@ class Article:
         """Rich output format for AI processing with source and summary"""
         return f"- Article Title: {self.title}\n Article Url: {self.url}\n Article Source: {self.source}\n Publication date: {self.published_at}\nArticle Summary: {self.summary}\n\n"
 
+    @cached_property
+    def rank_fragment(self):
+        """Title/summary/URL block for ranking prompts (built once; callers add the index)"""
+        return f"{self.title}\nSummary: {(self.summary or '')[:200]}...\nURL: {self.url}"
+
+    @cached_property
+    def dedup_key(self):
+        """Identity for duplicate detection: arXiv ID without version, else the URL"""
+        url = (self.url or "").rstrip("/")
+        if "arxiv.org" in url:
+            return "arxiv:" + _ARXIV_VERSION_RE.sub("", url.rsplit("/", 1)[-1])
+        return url
+
     def json(self):
         return {
             'id': self.id,
@@ -36,6 +54,20 @@ class Article:
             'hashed_summary': self.hashed_summary
         }
 
+def unique_articles(articles):
+    """First occurrence of each article by dedup_key, in order"""
+    seen = set()
+    unique = []
+    for article in articles:
+        key = article.dedup_key
+        if key:  # articles without a URL cannot be matched up
+            if key in seen:
+                continue
+            seen.add(key)
+        unique.append(article)
+    return unique
+
+
 class Group:
     def __init__(self, id=None, text=None, created_at=None, parent_id=None, articles=None):
         self.id = id
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+"""
+Embedding Cache Module
+
+Provides local SQLite caching for article embeddings. arXiv URLs are stable
+identifiers, so a paper that reappears in the next run's feed window is not
+sent to the embeddings API again.
+"""
+
+import sqlite3
+import os
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from contextlib import contextmanager
+
+# Papers leave the feed window within days, so older vectors are never looked
+# up again; they are pruned whenever the cache is opened
+MAX_AGE_DAYS = 30
+
+
+class EmbeddingCache:
+    """Local SQLite cache of embedding vectors keyed by (model, url)."""
+
+    # SQLite's default limit on host parameters per statement is 999
+    _QUERY_CHUNK = 500
+
+    def __init__(self, db_path: Optional[str] = None, max_age_days: int = MAX_AGE_DAYS):
+        """
+        Initialize embedding cache.
+
+        Args:
+            db_path: Path to SQLite database file. Defaults to briefings/embeddings_cache.db
+            max_age_days: Vectors cached longer ago than this are deleted on open
+        """
+        if db_path is None:
+            db_path = os.path.join(
+                os.path.dirname(os.path.abspath(__file__)),
+                "briefings",
+                "embeddings_cache.db"
+            )
+
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._init_db()
+        self.clear_old_data(max_age_days)
+
+    @contextmanager
+    def _get_connection(self):
+        """Context manager for database connections."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        """Initialize database schema."""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT,
+                    url TEXT,
+                    vector BLOB,
+                    last_updated TEXT,
+                    PRIMARY KEY (model, url)
+                )
+            """)
+
+    def get_many(self, model: str, urls: Iterable[str]) -> Dict[str, List[float]]:
+        """
+        Look up cached vectors.
+
+        Args:
+            model: Embedding model/deployment name
+            urls: Article URLs to look up
+
+        Returns:
+            Dictionary of url -> vector for the URLs that were cached
+        """
+        urls = list(urls)
+        found = {}
+        with self._get_connection() as conn:
+            for i in range(0, len(urls), self._QUERY_CHUNK):
+                chunk = urls[i:i + self._QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT url, vector FROM embeddings WHERE model = ? AND url IN ({placeholders})",
+                    [model, *chunk],
+                )
+                for url, blob in rows:
+                    found[url] = array("d", blob).tolist()
+        return found
+
+    def put_many(self, model: str, items: Iterable[Tuple[str, List[float]]]):
+        """
+        Cache vectors.
+
+        Args:
+            model: Embedding model/deployment name
+            items: (url, vector) pairs
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._get_connection() as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO embeddings (model, url, vector, last_updated)
+                VALUES (?, ?, ?, ?)
+            """, [(model, url, array("d", vec).tobytes(), now) for url, vec in items])
+
+    def clear_old_data(self, max_age_days: int = MAX_AGE_DAYS):
+        """
+        Delete vectors cached more than max_age_days ago.
+
+        Args:
+            max_age_days: Maximum age to keep in days
+        """
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=max_age_days)).isoformat()
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM embeddings WHERE last_updated < ?", (cutoff,))
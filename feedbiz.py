@@ -25,11 +25,21 @@ def feedbiz(feed: str,whitelist=None, blacklist=None) -> Sequence[str]:
     ]
     print("little_news:",feed, len(little_news))
     smash_news = [[f"- [{item['title']}]({item['url']})\n\t - {item['summary']}",item] for item in little_news if item['summary']]
-    if whitelist:
-        smash_news = [xx for xx in smash_news if any(word.lower() in xx[0].lower() for word in whitelist)]
     if blacklist:
         print(blacklist)
-        smash_news = [xx for xx in smash_news if not any(word.lower() in xx[0].lower() for word in blacklist)]
+    if whitelist or blacklist:
+        # Lowercase each item and each word once, not once per comparison
+        whitelist = [word.lower() for word in whitelist or []]
+        blacklist = [word.lower() for word in blacklist or []]
+        kept = []
+        for xx in smash_news:
+            text = xx[0].lower()
+            if whitelist and not any(word in text for word in whitelist):
+                continue
+            if any(word in text for word in blacklist):
+                continue
+            kept.append(xx)
+        smash_news = kept
     print("little_news:",feed, len(smash_news))
 
     return [f"- [{xx[1].get('title','')}]({xx[1].get('url','')})" for xx in smash_news]
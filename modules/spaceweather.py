@@ -2,6 +2,16 @@ import requests
 import re
 import base64
 
+# Forecast-text patterns, compiled once
+_KP_RE = re.compile(r'(\d+\.?\d*)\s+(?=\d+\.?\d*\s+\d+\.?\d*\s*$)', re.MULTILINE)
+_KP_FALLBACK_RE = re.compile(r'Kp\s*(\d+\.?\d*)')
+_FLUX_RE = re.compile(r'10\.7\s*cm\s*Radio\s*Flux[:\s]*(\d+)', re.IGNORECASE)
+_GEOMAG_RE = re.compile(r'(\w{3}\s+\d{2})\s+(\w+(?:\s+to\s+\w+)?)', re.MULTILINE)
+_FLUX_RANGE_RE = re.compile(r'Solar flux\s+(\d+)\s+to\s+(\d+)', re.IGNORECASE)
+_GEOMAG_SECTION_RE = re.compile(r'Geomagnetic Activity.*?(?=No space|\Z)', re.DOTALL | re.IGNORECASE)
+_RADIATION_RE = re.compile(r'Solar Radiation.*?(\w+)', re.IGNORECASE)
+_RADIO_BLACKOUT_RE = re.compile(r'Radio Blackout.*?(\w+)', re.IGNORECASE)
+
 class SpaceWeather(object):
     def __init__(self):
         pass
@@ -9,15 +19,15 @@ class SpaceWeather(object):
     def _parse_kp_index(self, text):
         """Extract Kp index values from forecast text"""
         # Look for decimal Kp values in the breakdown table
-        kp_matches = re.findall(r'(\d+\.?\d*)\s+(?=\d+\.?\d*\s+\d+\.?\d*\s*$)', text, re.MULTILINE)
+        kp_matches = _KP_RE.findall(text)
         if not kp_matches:
             # Fallback to looking for "Kp X" pattern
-            kp_matches = re.findall(r'Kp\s*(\d+\.?\d*)', text)
+            kp_matches = _KP_FALLBACK_RE.findall(text)
         return [float(k) for k in kp_matches] if kp_matches else []
     
     def _parse_solar_flux(self, text):
         """Extract solar flux values"""
-        flux_matches = re.findall(r'10\.7\s*cm\s*Radio\s*Flux[:\s]*(\d+)', text, re.IGNORECASE)
+        flux_matches = _FLUX_RE.findall(text)
         return [int(f) for f in flux_matches] if flux_matches else []
     
     def _create_kp_chart(self, kp_values, width=200, height=40):
@@ -80,8 +90,7 @@ class SpaceWeather(object):
     def _parse_geomag_activity(self, text):
         """Extract geomagnetic activity levels from forecast"""
         # Look for lines like "Geomagnetic Activity Summary:" followed by date and activity level
-        activity_pattern = re.compile(r'(\w{3}\s+\d{2})\s+(\w+(?:\s+to\s+\w+)?)', re.MULTILINE)
-        matches = activity_pattern.findall(text)
+        matches = _GEOMAG_RE.findall(text)
         return matches[:3]  # Return first 3 days
 
     def _get_activity_emoji(self, activity):
@@ -109,13 +118,13 @@ class SpaceWeather(object):
         output = []
 
         # Parse Solar Activity
-        solar_flux_match = re.search(r'Solar flux\s+(\d+)\s+to\s+(\d+)', text, re.IGNORECASE)
+        solar_flux_match = _FLUX_RANGE_RE.search(text)
         if solar_flux_match:
             flux_low, flux_high = solar_flux_match.groups()
             output.append(f"☀️ **Solar Flux**: {flux_low}-{flux_high} sfu")
 
         # Parse Geomagnetic Activity
-        geomag_section = re.search(r'Geomagnetic Activity.*?(?=No space|\Z)', text, re.DOTALL | re.IGNORECASE)
+        geomag_section = _GEOMAG_SECTION_RE.search(text)
         if geomag_section:
             geomag_text = geomag_section.group()
             # Look for activity levels
@@ -131,12 +140,12 @@ class SpaceWeather(object):
                 output.append(f"⚪ **Geomagnetic**: Normal")
 
         # Parse Solar Radiation
-        radiation_match = re.search(r'Solar Radiation.*?(\w+)', text, re.IGNORECASE)
+        radiation_match = _RADIATION_RE.search(text)
         if radiation_match and 'none' not in radiation_match.group().lower():
             output.append(f"☢️ **Solar Radiation**: Elevated")
 
         # Parse Radio Blackouts
-        radio_match = re.search(r'Radio Blackout.*?(\w+)', text, re.IGNORECASE)
+        radio_match = _RADIO_BLACKOUT_RE.search(text)
         if radio_match and 'none' not in radio_match.group().lower():
             output.append(f"📡 **Radio Blackout**: Possible")
 
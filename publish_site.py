@@ -14,15 +14,39 @@ Environment:
     PAGES_DIR (or GITHUB_PAGES_DIR)  — path to local clone of tumble-dry-low.github.io
 """
 
-import argparse
+import concurrent.futures
+import gzip
+import hashlib
 import html as html_mod
 import json
+import multiprocessing
 import os
+import queue
 import re
 import shutil
 import subprocess
 import sys
+import threading
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from markupsafe import escape as _markup_escape
+    MARKUPSAFE_AVAILABLE = True
+except ImportError:
+    MARKUPSAFE_AVAILABLE = False
 
 # Ensure H3lPeR modules are importable
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -36,6 +60,23 @@ PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 BRIEFINGS_DIR = os.path.join(PROJECT_ROOT, "briefings")
 WEB_PUBLIC_DIR = os.path.join(PROJECT_ROOT, "web", "public")
 
+# Output directories for generated pages (static assets create their own)
+SITE_SUBDIRS = ("briefings", "dashboard", "hazards", "citations")
+
+# Below this many briefings to render, a process pool costs more than it saves
+PARALLEL_RENDER_MIN = 2
+
+# Archive entries rendered server-side; the rest are loaded by archive.js
+ARCHIVE_PRERENDER = 50
+
+# Per-site record of source hashes, used to skip unchanged briefings
+BUILD_STATE_FILENAME = ".build_state.json"
+
+# Bump whenever the page chrome or page templates change; a build whose
+# recorded version differs regenerates every page instead of trusting
+# mtimes and source hashes.
+TEMPLATE_VERSION = 1
+
 
 # =============================================================================
 # Preferences
@@ -54,25 +95,53 @@ def _load_preferences():
     return {}
 
 
+# =============================================================================
+# JSON helpers
+# =============================================================================
+
+def _json_loads(data):
+    """Parse JSON from str/bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, sort_keys=False):
+    """Serialize obj to a compact JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SORT_KEYS if sort_keys else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, sort_keys=sort_keys)
+
+
 # =============================================================================
 # Templates
 # =============================================================================
 
-def _page_wrapper(title, body, active_page="", extra_head=""):
-    """Wrap body HTML in the full page chrome (Pico CSS, nav, footer)."""
-    def _nav_class(page):
-        return ' class="active"' if page == active_page else ""
+if MARKUPSAFE_AVAILABLE:
+    def _esc(value):
+        """HTML-escape value (markupsafe's C implementation)."""
+        return str(_markup_escape(value))
+else:
+    _esc = html_mod.escape
+
 
-    return f"""<!DOCTYPE html>
+# Static page chrome, split around the parts that vary per page (title,
+# extra <head> content, active nav item, body) and joined in _page_wrapper.
+_HEAD_OPEN = """<!DOCTYPE html>
 <html lang="en" data-theme="light">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{html_mod.escape(title)} — H3lPeR</title>
+  <title>"""
+
+_HEAD_LINKS = """ — H3lPeR</title>
   <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/@picocss/pico@2/css/pico.min.css">
   <link rel="stylesheet" href="/css/style.css">
   <script src="https://cdn.jsdelivr.net/npm/chart.js@4"></script>
-{extra_head}
+"""
+
+_NAV_TEMPLATE = """
 </head>
 <body>
   <nav class="container-fluid">
@@ -80,16 +149,27 @@ def _page_wrapper(title, body, active_page="", extra_head=""):
       <li><strong>H3lPeR</strong></li>
     </ul>
     <ul>
-      <li><a href="/"{_nav_class("home")}>Latest</a></li>
-      <li><a href="/dashboard/"{_nav_class("dashboard")}>Dashboard</a></li>
-      <li><a href="/hazards/"{_nav_class("hazards")}>Hazards</a></li>
-      <li><a href="/citations/"{_nav_class("citations")}>Citations</a></li>
-      <li><a href="/briefings/"{_nav_class("briefings")}>Archive</a></li>
+      <li><a href="/"{home}>Latest</a></li>
+      <li><a href="/dashboard/"{dashboard}>Dashboard</a></li>
+      <li><a href="/hazards/"{hazards}>Hazards</a></li>
+      <li><a href="/citations/"{citations}>Citations</a></li>
+      <li><a href="/briefings/"{briefings}>Archive</a></li>
       <li><button id="theme-toggle" class="theme-toggle" aria-label="Toggle dark mode">🌙</button></li>
     </ul>
   </nav>
   <main class="container">
-{body}
+"""
+
+_NAV_PAGES = ("home", "dashboard", "hazards", "citations", "briefings")
+
+_NAV_BY_PAGE = {
+    active: _NAV_TEMPLATE.format_map(
+        {page: ' class="active"' if page == active else "" for page in _NAV_PAGES}
+    )
+    for active in _NAV_PAGES + ("",)
+}
+
+_FOOTER = """
   </main>
   <footer class="container">
     <small>H3lPeR — Personal Briefing System</small>
@@ -99,10 +179,27 @@ def _page_wrapper(title, body, active_page="", extra_head=""):
 </html>"""
 
 
+@lru_cache(maxsize=8)
+def _wrapper_skeleton(active_page, extra_head):
+    """Chrome between the <title> text and the body for one page variant.
+
+    Only a handful of (active_page, extra_head) combinations exist, so each
+    is assembled once and reused for every page of that kind.
+    """
+    return "".join((_HEAD_LINKS, extra_head, _NAV_BY_PAGE.get(active_page, _NAV_BY_PAGE[""])))
+
+
+def _page_wrapper(title, body, active_page="", extra_head=""):
+    """Wrap body HTML in the full page chrome (Pico CSS, nav, footer)."""
+    return "".join((
+        _HEAD_OPEN, _esc(title), _wrapper_skeleton(active_page, extra_head), body, _FOOTER,
+    ))
+
+
 def _dashboard_page(stock_symbols):
     """Generate dashboard body HTML."""
-    symbols_json = json.dumps([{"s": s} for s in stock_symbols])
-    tv_config = json.dumps({
+    symbols_json = _json_dumps([{"s": s} for s in stock_symbols])
+    tv_config = _json_dumps({
         "colorTheme": "light",
         "dateRange": "1D",
         "showChart": True,
@@ -229,11 +326,19 @@ def _hazards_page():
     return body
 
 
-def _citations_page():
-    """Generate citations page body HTML showing top cited papers."""
-    # Load citation data
+def _load_citation_data():
     from citations_data import load_citation_data
-    citation_data = load_citation_data()
+    return load_citation_data()
+
+
+def _citations_page(citation_data=None):
+    """Generate citations page body HTML showing top cited papers.
+
+    citation_data: output of citations_data.load_citation_data(); loaded
+    here when not supplied.
+    """
+    if citation_data is None:
+        citation_data = _load_citation_data()
     
     if not citation_data:
         body = """
@@ -255,7 +360,7 @@ def _citations_page():
 <h1>📊 Most Cited Papers</h1>
 <article>
   <header>⚠️ Citation Analysis Issue</header>
-  <p>The citation analysis encountered an issue: <strong>{html_mod.escape(error)}</strong></p>
+  <p>The citation analysis encountered an issue: <strong>{_esc(error)}</strong></p>
   <details>
     <summary>Troubleshooting Tips</summary>
     <ul>
@@ -278,7 +383,7 @@ def _citations_page():
 <article>
   <header>No Papers Found</header>
   <p>Citation analysis ran successfully but found no papers meeting the criteria.</p>
-  <p><small>Last run: {html_mod.escape(generated_at)}</small></p>
+  <p><small>Last run: {_esc(generated_at)}</small></p>
   <details>
     <summary>Possible Reasons</summary>
     <ul>
@@ -315,12 +420,12 @@ def _citations_page():
     # Build papers HTML
     papers_html = []
     for i, paper in enumerate(papers, 1):
-        title = html_mod.escape(paper.get('title', 'Untitled'))
-        url = html_mod.escape(paper.get('url', '#'))
+        title = _esc(paper.get('title', 'Untitled'))
+        url = _esc(paper.get('url', '#'))
         
         # Handle summary with proper escaping and truncation
         full_summary = paper.get('summary', '')
-        summary = html_mod.escape(full_summary[:400])
+        summary = _esc(full_summary[:400])
         if len(full_summary) > 400:
             summary += "..."
         
@@ -355,7 +460,7 @@ def _model_pill(model_name):
     """Render a small pill badge for the model name."""
     if not model_name:
         return ""
-    escaped = html_mod.escape(str(model_name))
+    escaped = _esc(str(model_name))
     return (
         f'<span style="display:inline-block;background-color:#7f8c8d;color:#fff;'
         f'font-size:10px;font-weight:600;padding:1px 7px;border-radius:9px;'
@@ -363,33 +468,60 @@ def _model_pill(model_name):
     )
 
 
+def _archive_index(briefings):
+    """Compact archive listing written to briefings/index.json for archive.js."""
+    return [
+        {"d": b["date_str"], "t": b["title"], "u": b["html_filename"],
+         "s": b["section_count"], "m": b.get("model")}
+        for b in briefings
+    ]
+
+
 def _briefings_archive_page(briefings):
     """Generate briefings archive list body HTML.
 
     briefings: list of dicts with keys: filename, date_str, title, section_count, model
+
+    Only the newest ARCHIVE_PRERENDER entries are rendered here; for longer
+    archives /js/archive.js appends the rest from briefings/index.json.
     """
-    if not briefings:
+    client_rendered = len(briefings) > ARCHIVE_PRERENDER
+    shown = briefings[:ARCHIVE_PRERENDER]
+    if not shown:
         items = "  <li><em>No briefings found</em></li>"
     else:
-        lines = []
-        for b in briefings:
-            html_file = b["html_filename"]
-            model = _model_pill(b.get("model", ""))
-            lines.append(
-                f'  <li><a href="/briefings/{html_mod.escape(html_file)}">'
-                f'<strong>{html_mod.escape(b["date_str"])}</strong>'
-                f'<small>{html_mod.escape(b["title"])} · {b["section_count"]} sections{model}</small>'
-                f'</a></li>'
-            )
+        # Only a handful of distinct models exist, so render each pill once
+        pills = {m: _model_pill(m) for m in {b.get("model") for b in shown}}
+        esc = _esc
+        lines = [None] * len(shown)
+        for i, b in enumerate(shown):
+            lines[i] = "".join((
+                '  <li><a href="/briefings/', esc(b["html_filename"]), '">',
+                '<strong>', esc(b["date_str"]), '</strong>',
+                '<small>', esc(b["title"]), ' · ', str(b["section_count"]), ' sections',
+                pills[b.get("model")], '</small>',
+                '</a></li>',
+            ))
         items = "\n".join(lines)
 
-    body = f"""
+    if not client_rendered:
+        return f"""
 <h1>Briefings</h1>
 <ul id="briefing-list">
 {items}
 </ul>
 """
-    return body
+
+    return f"""
+<h1>Briefings</h1>
+<ul id="briefing-list" data-index="/briefings/index.json">
+{items}
+</ul>
+<script src="/js/archive.js"></script>
+"""
+
+
+_STYLE_RE = re.compile(r'\s*style="[^"]*"')
 
 
 def _strip_inline_styles(html_str):
@@ -398,7 +530,7 @@ def _strip_inline_styles(html_str):
     Email rendering needs inline styles, but the static site uses CSS classes
     so that Pico CSS dark/light theming works correctly.
     """
-    return re.sub(r'\s*style="[^"]*"', '', html_str)
+    return _STYLE_RE.sub('', html_str)
 
 
 def _briefing_page(briefing_content_html, title, date_str, model=None):
@@ -407,7 +539,7 @@ def _briefing_page(briefing_content_html, title, date_str, model=None):
     # Strip inline styles so CSS dark mode theming works
     clean_html = _strip_inline_styles(briefing_content_html)
     body = f"""
-<h1>{html_mod.escape(title)} {model_html}</h1>
+<h1>{_esc(title)} {model_html}</h1>
 <p><a href="/briefings/">← Back to all briefings</a></p>
 <div id="briefing-content">
   {clean_html}
@@ -420,6 +552,52 @@ def _briefing_page(briefing_content_html, title, date_str, model=None):
 # Briefing discovery
 # =============================================================================
 
+def _hash_bytes(data):
+    """Short content hash used for incremental-build bookkeeping."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _load_briefing_doc(fpath):
+    """Load a full briefing JSON document from disk."""
+    with open(fpath, "rb") as f:
+        return _json_loads(f.read())
+
+
+def _extract_briefing_meta(fpath):
+    """Read just the title, section count and model from a briefing JSON.
+
+    The archive only needs these three fields, so when ijson is available the
+    file is streamed instead of materializing the whole document.
+
+    Raises ValueError (or OSError) if the file cannot be parsed.
+    """
+    if not IJSON_AVAILABLE:
+        doc = _load_briefing_doc(fpath)
+        return {
+            "title": doc.get("title", "Untitled Briefing"),
+            "section_count": len(doc.get("children", [])),
+            "model": doc.get("model"),
+        }
+
+    meta = {"title": "Untitled Briefing", "section_count": 0, "model": None}
+    try:
+        with open(fpath, "rb") as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == "title" and event == "string":
+                    meta["title"] = value
+                elif prefix == "model" and event != "map_key":
+                    meta["model"] = value
+                elif prefix == "children.item" and event not in ("map_key", "end_map", "end_array"):
+                    meta["section_count"] += 1
+    except ijson.JSONError as e:
+        raise ValueError(str(e)) from e
+    return meta
+
+
+# e.g. 260207-a64a7c51426d.json → yy=26, mm=02, dd=07, rest=a64a7c51426d
+_FNAME_RE = re.compile(r"^(?P<yy>\d{2})(?P<mm>\d{2})(?P<dd>\d{2})-(?P<rest>.*)\.json$")
+
+
 def _discover_briefings():
     """Scan briefings/ directory, return list of briefing metadata sorted newest-first.
 
@@ -429,37 +607,35 @@ def _discover_briefings():
     if not os.path.isdir(BRIEFINGS_DIR):
         return []
 
-    files = [f for f in os.listdir(BRIEFINGS_DIR) if f.endswith(".json")]
+    with os.scandir(BRIEFINGS_DIR) as it:
+        files = [entry for entry in it if entry.name.endswith(".json")]
     if not files:
         return []
 
     entries = []
-    for fname in files:
-        fpath = os.path.join(BRIEFINGS_DIR, fname)
-        match = re.match(r"^(\d{6})-", fname)
+    for entry in files:
+        fname = entry.name
+        fpath = entry.path
+        match = _FNAME_RE.match(fname)
         if not match:
             continue
-        yy, mm, dd = match.group(1)[:2], match.group(1)[2:4], match.group(1)[4:6]
-        date_str = f"20{yy}-{mm}-{dd}"
-        stem = fname.rsplit(".", 1)[0]  # e.g. "260207-a64a7c51426d"
+        yy, mm, dd, rest = match.group("yy", "mm", "dd", "rest")
 
         try:
-            with open(fpath, "r") as f:
-                doc = json.load(f)
-        except (json.JSONDecodeError, OSError):
+            meta = _extract_briefing_meta(fpath)
+        except (ValueError, OSError):
             continue
 
         entries.append({
             "json_filename": fname,
             "json_path": fpath,
-            "date_str": date_str,
+            "date_str": f"20{yy}-{mm}-{dd}",
             "date_sort": f"20{yy}{mm}{dd}",
-            "html_filename": f"{stem}.html",
-            "title": doc.get("title", "Untitled Briefing"),
-            "section_count": len(doc.get("children", [])),
-            "model": doc.get("model"),
-            "doc": doc,
-            "mtime": os.path.getmtime(fpath),
+            "html_filename": f"{yy}{mm}{dd}-{rest}.html",
+            "title": meta["title"],
+            "section_count": meta["section_count"],
+            "model": meta["model"],
+            "mtime": entry.stat().st_mtime,
         })
 
     # Sort newest-first by date, then by mtime within same date
@@ -471,47 +647,328 @@ def _discover_briefings():
 # Static asset copying
 # =============================================================================
 
-def _copy_static_assets(site_dir):
-    """Copy CSS, JS, and vendor files from web/public/ to the site directory."""
+def _copy_file(src, dst):
+    """Copy file contents and mtime, letting the kernel move the data when it can."""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _copy_if_changed(src, dst, src_stat=None):
+    """Copy src to dst unless dst has the same size and mtime.
+
+    Mtimes are compared for equality, not order: a source restored with an
+    older mtime (cp -p, rsync -t, tar) is still a change.
+
+    Returns:
+        True if the file was copied
+    """
+    src_stat = src_stat or os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        pass
+    else:
+        if (dst_stat.st_size == src_stat.st_size
+                and dst_stat.st_mtime_ns == src_stat.st_mtime_ns):
+            return False
+    _copy_file(src, dst)
+    return True
+
+
+def _copy_static_assets(site_dir, manifest=None):
+    """Copy CSS, JS, and vendor files from web/public/ to the site directory.
+
+    Args:
+        site_dir: Output site directory
+        manifest: {relpath: [src_mtime_ns, src_size]} from the previous run;
+            files whose source is unchanged and whose copy exists are skipped,
+            files whose source changed are always copied, and files with no
+            entry are copied unless the copy matches the source's size and mtime
+
+    Returns:
+        (new_manifest, copied_paths)
+    """
+    manifest = manifest or {}
+    new_manifest = {}
+    copied = []
     for subdir in ("css", "js", "vendor"):
-        src = os.path.join(WEB_PUBLIC_DIR, subdir)
-        dst = os.path.join(site_dir, subdir)
-        if not os.path.isdir(src):
+        src_root = os.path.join(WEB_PUBLIC_DIR, subdir)
+        if not os.path.isdir(src_root):
             continue
-        shutil.copytree(src, dst, dirs_exist_ok=True)
+        for dirpath, _dirnames, filenames in os.walk(src_root):
+            rel_dir = os.path.relpath(dirpath, WEB_PUBLIC_DIR)
+            dst_dir = os.path.join(site_dir, rel_dir)
+            os.makedirs(dst_dir, exist_ok=True)
+            for name in filenames:
+                src = os.path.join(dirpath, name)
+                dst = os.path.join(dst_dir, name)
+                rel = os.path.join(rel_dir, name)
+                st = os.stat(src)
+                sig = [st.st_mtime_ns, st.st_size]
+                new_manifest[rel] = sig
+                prev_sig = manifest.get(rel)
+                if prev_sig is None:
+                    if _copy_if_changed(src, dst, st):
+                        copied.append(dst)
+                elif prev_sig != sig or not os.path.exists(dst):
+                    _copy_file(src, dst)
+                    copied.append(dst)
+    return new_manifest, copied
 
 
 # =============================================================================
 # Site generation
 # =============================================================================
 
-def generate_site(site_dir, incremental=True):
+def _same_content(path, data):
+    """True if path already holds exactly the bytes in data."""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def _write_atomic_bytes(path, data):
+    """Write data to path with a raw fd and an atomic rename.
+
+    The bytes go to path + ".tmp" in (normally) a single os.write(), then
+    replace path, so readers never see a half-written file.
+    """
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+
+
+def _write(path, text, precompress=False):
+    """Write text to path as UTF-8, atomically and in one write() call.
+
+    Files that already hold identical content are left untouched, keeping
+    their mtime and keeping them out of the next git commit.
+
+    With precompress, also write a gzipped copy to path + ".gz" for static
+    hosts that serve pre-compressed files. The gzip header mtime is pinned
+    so unchanged pages produce identical .gz files.
+
+    Returns:
+        List of paths actually (re)written
+    """
+    data = text.encode("utf-8")
+    written = []
+    if not _same_content(path, data):
+        _write_atomic_bytes(path, data)
+        written.append(path)
+    if precompress and (written or not os.path.exists(path + ".gz")):
+        _write_atomic_bytes(path + ".gz", gzip.compress(data, compresslevel=9, mtime=0))
+        written.append(path + ".gz")
+    return written
+
+
+def _file_writer(q, written, errors, precompress=False):
+    """Writer thread: drain (path, text) pairs from q until a None sentinel.
+
+    Paths that were actually rewritten are appended to written; a failed
+    write is recorded in errors as {path: exception} and the thread moves
+    on, leaving the caller to raise it.
+    """
+    while True:
+        item = q.get()
+        if item is None:
+            return
+        path, text = item
+        try:
+            written.extend(_write(path, text, precompress))
+        except Exception as e:
+            print(f"  ⚠ Could not write {path}: {e}")
+            errors[path] = e
+
+
+def _load_build_state(site_dir):
+    """Load the incremental-build state recorded by the previous run."""
+    try:
+        with open(os.path.join(site_dir, BUILD_STATE_FILENAME), "rb") as f:
+            state = _json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_build_state(site_dir, state):
+    """Persist the incremental-build state for the next run.
+
+    Returns:
+        True if the state changed and was written
+    """
+    path = os.path.join(site_dir, BUILD_STATE_FILENAME)
+    return bool(_write(path, _json_dumps(state, sort_keys=True)))
+
+
+def _render_one_briefing(b, prev_hash, keep_body, site_dir, incremental=True):
+    """Render a single briefing page for site_dir/briefings/.
+
+    Runs inside a worker process and does no I/O on the output side; the
+    parent hands the rendered page to the writer thread. Pages whose HTML
+    is newer than the source JSON are filtered out before this is called.
+
+    Args:
+        b: Briefing entry from _discover_briefings()
+        prev_hash: Source hash recorded when the page was last generated
+        keep_body: Also return the page body (used to build the landing page)
+        site_dir: Output site directory
+        incremental: If True, skip pages whose source is unchanged
+
+    Returns:
+        (status, payload, src_hash) where status is "generated" (payload is
+        a (path, html, body) tuple, body being None unless keep_body),
+        "skipped" (payload is None) or "error"
+        (payload is the error message). src_hash is None when the source
+        could not be read.
+    """
+    html_path = os.path.join(site_dir, "briefings", b["html_filename"])
+    html_exists = incremental and os.path.exists(html_path)
+
+    try:
+        with open(b["json_path"], "rb") as f:
+            raw = f.read()
+    except OSError as e:
+        return "error", str(e), None
+    src_hash = _hash_bytes(raw)
+
+    # mtime can move without the content changing (checkout, rsync, cp -p)
+    if html_exists and src_hash == prev_hash:
+        return "skipped", None, src_hash
+
+    try:
+        doc = _json_loads(raw)
+        validate_briefing_json(doc)
+        content_html = render_briefing_content(doc)
+    except Exception as e:
+        return "error", str(e), src_hash
+
+    body = _briefing_page(content_html, b["title"], b["date_str"], model=b.get("model"))
+    page_html = _page_wrapper(b["title"], body, active_page="briefings")
+    return "generated", (html_path, page_html, body if keep_body else None), src_hash
+
+
+# Site dirs whose skeleton has been created by this process
+_SKELETON_READY = set()
+
+
+def _ensure_site_skeleton(site_dir):
+    """Create the output directories and .nojekyll once per process.
+
+    Returns:
+        Paths created by this call (for git_publish)
+    """
+    if site_dir in _SKELETON_READY:
+        return []
+    # Create every output directory up front so nothing later (including the
+    # writer thread) has to
+    for subdir in SITE_SUBDIRS:
+        os.makedirs(os.path.join(site_dir, subdir), exist_ok=True)
+
+    # .nojekyll prevents GitHub Pages from processing the site with Jekyll
+    created = []
+    nojekyll = os.path.join(site_dir, ".nojekyll")
+    try:
+        os.close(os.open(nojekyll, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+        created.append(nojekyll)
+    except FileExistsError:
+        pass
+    _SKELETON_READY.add(site_dir)
+    return created
+
+
+def _render_archive(briefings):
+    """Archive page HTML and its index.json payload (metadata only)."""
+    archive_body = _briefings_archive_page(briefings)
+    return (_page_wrapper("Archive", archive_body, active_page="briefings"),
+            _json_dumps(_archive_index(briefings)))
+
+
+def _render_latest_body(latest):
+    """Render the latest briefing's page body from its source JSON."""
+    doc = _load_briefing_doc(latest["json_path"])
+    validate_briefing_json(doc)
+    content_html = render_briefing_content(doc)
+    return _briefing_page(content_html, latest["title"], latest["date_str"],
+                          model=latest.get("model"))
+
+
+def generate_site(site_dir, incremental=True, precompress=False):
     """Generate the full static site into site_dir.
 
     Args:
         site_dir: Path to the local clone of tumble-dry-low.github.io
         incremental: If True, skip briefing HTML files that already exist
+        precompress: If True, write a .html.gz next to every HTML page
+            (GitHub Pages ignores these; useful for nginx/Netlify-style hosts)
+
+    Returns:
+        List of paths whose content changed during this run (for git_publish)
     """
-    os.makedirs(site_dir, exist_ok=True)
-    os.makedirs(os.path.join(site_dir, "briefings"), exist_ok=True)
-    os.makedirs(os.path.join(site_dir, "dashboard"), exist_ok=True)
+    created = _ensure_site_skeleton(site_dir)
 
     prefs = _load_preferences()
     stock_symbols = prefs.get("stock_symbols", ["MSFT", "NVDA", "FOREXCOM:DJI", "FOREXCOM:SPX500"])
 
+    build_state = _load_build_state(site_dir)
+    if build_state.get("template_version") != TEMPLATE_VERSION:
+        # Pages on disk were rendered by different templates
+        incremental = False
+    build_state["template_version"] = TEMPLATE_VERSION
+    prev_page_hashes = build_state.get("pages", {})
+    page_hashes = build_state["pages"] = {}
+
+    written = list(created)
+
+    def _emit(path, text):
+        """Write a page (if changed) and remember it for git_publish."""
+        written.extend(_write(path, text, precompress))
+
+    def _page_unchanged(key, path, inputs):
+        """Record the input hash for a page; True if it can be left as is."""
+        page_hashes[key] = _hash_bytes(_json_dumps(inputs, sort_keys=True).encode("utf-8"))
+        return (incremental and prev_page_hashes.get(key) == page_hashes[key]
+                and os.path.exists(path))
+
     # 1. Copy static assets
-    _copy_static_assets(site_dir)
-    print("✓ Static assets copied")
+    build_state["assets"], copied = _copy_static_assets(site_dir, build_state.get("assets"))
+    written.extend(copied)
+    print(f"✓ Static assets copied ({len(copied)} updated)")
 
     # 2. Dashboard (/dashboard/index.html)
-    dashboard_body = _dashboard_page(stock_symbols)
-    dashboard_html = _page_wrapper("Dashboard", dashboard_body, active_page="dashboard")
-    with open(os.path.join(site_dir, "dashboard", "index.html"), "w") as f:
-        f.write(dashboard_html)
-    print("✓ Dashboard generated")
+    dashboard_path = os.path.join(site_dir, "dashboard", "index.html")
+    if _page_unchanged("dashboard", dashboard_path, stock_symbols):
+        print("✓ Dashboard unchanged")
+    else:
+        dashboard_body = _dashboard_page(stock_symbols)
+        dashboard_html = _page_wrapper("Dashboard", dashboard_body, active_page="dashboard")
+        _emit(dashboard_path, dashboard_html)
+        print("✓ Dashboard generated")
 
     # 3. Hazards map (/hazards/index.html)
-    os.makedirs(os.path.join(site_dir, "hazards"), exist_ok=True)
     hazards_body = _hazards_page()
     leaflet_head = (
         '  <link rel="stylesheet" href="/vendor/leaflet/leaflet.css">\n'
@@ -519,107 +976,198 @@ def generate_site(site_dir, incremental=True):
     )
     hazards_html = _page_wrapper("Natural Hazards Map", hazards_body,
                                   active_page="hazards", extra_head=leaflet_head)
-    with open(os.path.join(site_dir, "hazards", "index.html"), "w") as f:
-        f.write(hazards_html)
+    _emit(os.path.join(site_dir, "hazards", "index.html"), hazards_html)
     print("✓ Hazards map generated")
 
     # 4. Citations page (/citations/index.html)
-    os.makedirs(os.path.join(site_dir, "citations"), exist_ok=True)
-    citations_body = _citations_page()
-    citations_html = _page_wrapper("Most Cited Papers", citations_body, active_page="citations")
-    with open(os.path.join(site_dir, "citations", "index.html"), "w") as f:
-        f.write(citations_html)
-    print("✓ Citations page generated")
+    citations_path = os.path.join(site_dir, "citations", "index.html")
+    citation_data = _load_citation_data()
+    if _page_unchanged("citations", citations_path, citation_data):
+        print("✓ Citations page unchanged")
+    else:
+        citations_body = _citations_page(citation_data)
+        citations_html = _page_wrapper("Most Cited Papers", citations_body, active_page="citations")
+        _emit(citations_path, citations_html)
+        print("✓ Citations page generated")
 
     # 5. Discover and render briefings
     briefings = _discover_briefings()
     generated = 0
     skipped = 0
-
-    for b in briefings:
-        html_path = os.path.join(site_dir, "briefings", b["html_filename"])
-
-        # Incremental: skip if HTML already exists and is newer than source JSON
-        if incremental and os.path.exists(html_path):
-            html_mtime = os.path.getmtime(html_path)
-            if html_mtime >= b["mtime"]:
-                skipped += 1
-                continue
-
-        try:
-            validate_briefing_json(b["doc"])
-            content_html = render_briefing_content(b["doc"])
-        except Exception as e:
-            print(f"  ⚠ Skipping {b['json_filename']}: {e}")
+    prev_hashes = build_state.get("briefings", {})
+    src_hashes = {}
+    latest_body = None
+
+    # Incremental: skip if HTML already exists and is newer than source JSON,
+    # so that only real work is handed to the renderers
+    to_render = []
+    for i, b in enumerate(briefings):
+        html_mtime = None
+        if incremental:
+            # One stat answers both "exists?" and "how old?"
+            try:
+                html_mtime = os.stat(os.path.join(site_dir, "briefings", b["html_filename"])).st_mtime
+            except FileNotFoundError:
+                pass
+        if html_mtime is not None and html_mtime >= b["mtime"]:
+            skipped += 1
+            if b["html_filename"] in prev_hashes:
+                src_hashes[b["html_filename"]] = prev_hashes[b["html_filename"]]
             continue
-
-        body = _briefing_page(content_html, b["title"], b["date_str"], model=b.get("model"))
-        page_html = _page_wrapper(b["title"], body, active_page="briefings")
-
-        with open(html_path, "w") as f:
-            f.write(page_html)
-        generated += 1
+        to_render.append((b, i == 0))
+
+    # The archive page and, when the latest briefing is not being re-rendered,
+    # the landing body depend only on briefing metadata, so build them on
+    # side threads while the briefing renderers run.
+    archive_path = os.path.join(site_dir, "briefings", "index.html")
+    archive_inputs = [
+        [b["html_filename"], b["date_str"], b["title"], b["section_count"], b.get("model")]
+        for b in briefings
+    ]
+    archive_unchanged = _page_unchanged("archive", archive_path, archive_inputs)
+    side = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+    archive_future = None if archive_unchanged else side.submit(_render_archive, briefings)
+    landing_future = None
+    if briefings and not (to_render and to_render[0][1]):
+        landing_future = side.submit(_render_latest_body, briefings[0])
+
+    # Briefings are independent of each other, so render them in parallel
+    # (when there are enough to pay for the pool) while a writer thread
+    # flushes finished pages to disk.
+    write_queue = queue.Queue()
+    write_errors = {}
+    writer = threading.Thread(target=_file_writer,
+                              args=(write_queue, written, write_errors, precompress),
+                              daemon=True)
+    writer.start()
+    render = partial(_render_one_briefing, site_dir=site_dir, incremental=incremental)
+    render_args = (
+        [b for b, _ in to_render],
+        [prev_hashes.get(b["html_filename"]) for b, _ in to_render],
+        [keep_body for _, keep_body in to_render],
+    )
+    executor = None
+    try:
+        if len(to_render) > PARALLEL_RENDER_MIN:
+            # The side and writer threads are already running; forking now
+            # could copy their held locks into the workers, so start them
+            # from a forkserver where the platform has one
+            mp_context = None
+            if "forkserver" in multiprocessing.get_all_start_methods():
+                mp_context = multiprocessing.get_context("forkserver")
+            executor = concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                                              mp_context=mp_context)
+            results = executor.map(render, *render_args, chunksize=4)
+        else:
+            results = map(render, *render_args)
+        for (b, _), (status, payload, src_hash) in zip(to_render, results):
+            if src_hash is not None:
+                src_hashes[b["html_filename"]] = src_hash
+            if status == "generated":
+                html_path, page_html, body = payload
+                write_queue.put((html_path, page_html))
+                if body is not None:
+                    latest_body = body
+                generated += 1
+            elif status == "skipped":
+                skipped += 1
+            else:
+                print(f"  ⚠ Skipping {b['json_filename']}: {payload}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        side.shutdown(wait=False)
+        write_queue.put(None)
+        writer.join()
+    if write_errors:
+        # Raise before the build state is saved: recording the source hashes
+        # of unwritten pages would make later runs skip them for good
+        raise next(iter(write_errors.values()))
+    build_state["briefings"] = src_hashes
 
     print(f"✓ Briefings: {generated} generated, {skipped} skipped (already exist)")
 
-    # 6. Briefings archive page (always regenerated)
-    archive_body = _briefings_archive_page(briefings)
-    archive_html = _page_wrapper("Archive", archive_body, active_page="briefings")
-    with open(os.path.join(site_dir, "briefings", "index.html"), "w") as f:
-        f.write(archive_html)
-    print(f"✓ Briefings archive ({len(briefings)} entries)")
+    # 6. Briefings archive page (regenerated when the listing changes)
+    if archive_future is None:
+        print(f"✓ Briefings archive unchanged ({len(briefings)} entries)")
+    else:
+        archive_html, archive_index = archive_future.result()
+        _emit(archive_path, archive_html)
+        _emit(os.path.join(site_dir, "briefings", "index.json"), archive_index)
+        print(f"✓ Briefings archive ({len(briefings)} entries)")
 
     # 7. Landing page = latest briefing (always regenerated)
     if briefings:
         latest = briefings[0]
         try:
-            validate_briefing_json(latest["doc"])
-            content_html = render_briefing_content(latest["doc"])
-            body = _briefing_page(content_html, latest["title"], latest["date_str"], model=latest.get("model"))
+            # Reuse the body rendered above unless the latest page was skipped
+            if landing_future is not None:
+                body = landing_future.result()
+            else:
+                body = latest_body
+            if body is None:
+                body = _render_latest_body(latest)
             landing_html = _page_wrapper(latest["title"], body, active_page="home")
-            with open(os.path.join(site_dir, "index.html"), "w") as f:
-                f.write(landing_html)
+            _emit(os.path.join(site_dir, "index.html"), landing_html)
             print(f"✓ Landing page: {latest['date_str']}")
         except Exception as e:
             print(f"⚠ Could not generate landing page: {e}")
     else:
         # No briefings yet — show archive page as landing
-        with open(os.path.join(site_dir, "index.html"), "w") as f:
-            f.write(_page_wrapper("H3lPeR", archive_body, active_page="home"))
-
-    # 8. .nojekyll to prevent GitHub Pages from processing with Jekyll
-    nojekyll = os.path.join(site_dir, ".nojekyll")
-    if not os.path.exists(nojekyll):
-        with open(nojekyll, "w") as f:
-            pass
+        archive_body = _briefings_archive_page(briefings)
+        _emit(os.path.join(site_dir, "index.html"),
+              _page_wrapper("H3lPeR", archive_body, active_page="home"))
 
-    return len(briefings)
+    if _save_build_state(site_dir, build_state):
+        written.append(os.path.join(site_dir, BUILD_STATE_FILENAME))
+    return written
 
 
 # =============================================================================
 # Git automation
 # =============================================================================
 
-def git_publish(site_dir):
-    """Commit and push changes in the site directory."""
-    def _git(*args):
+def git_publish(site_dir, paths=None):
+    """Commit and push changes in the site directory.
+
+    Args:
+        site_dir: Local clone of the GitHub Pages repository
+        paths: Files written by generate_site(); None stages everything.
+            Pages are only rewritten when they change, so output from an
+            earlier run that never got committed (a --no-push run, a failed
+            commit) is not in this list; anything git still reports as
+            unstaged is added as well.
+    """
+    def _git(*args, input=None):
         result = subprocess.run(
             ["git"] + list(args),
             cwd=site_dir,
             capture_output=True,
             text=True,
+            input=input,
         )
         return result
 
-    # Check if it's a git repo
-    r = _git("rev-parse", "--git-dir")
+    # Stage changes (this also tells us whether it's a git repo)
+    if paths:
+        pathspec = "\0".join(os.path.relpath(p, site_dir) for p in paths)
+        r = _git("add", "--pathspec-from-file=-", "--pathspec-file-nul", input=pathspec)
+        if r.returncode == 0:
+            # Leftovers from earlier unpublished runs: untracked ("??") or
+            # modified but unstaged (second status column set)
+            status = _git("status", "--porcelain")
+            if any(line[:2] == "??" or line[1:2] not in (" ", "")
+                   for line in status.stdout.splitlines()):
+                r = _git("add", ".")
+    else:
+        r = _git("add", ".")
     if r.returncode != 0:
-        print(f"⚠ {site_dir} is not a git repository — skipping publish")
+        if "not a git repository" in r.stderr:
+            print(f"⚠ {site_dir} is not a git repository — skipping publish")
+        else:
+            print(f"⚠ Git add failed: {r.stderr.strip()}")
         return False
 
-    # Stage all changes
-    _git("add", ".")
-
     # Check if there are changes to commit
     r = _git("diff", "--cached", "--quiet")
     if r.returncode == 0:
@@ -634,14 +1182,11 @@ def git_publish(site_dir):
         return False
     print(f"✓ Committed: Briefing {today}")
 
-    # Push
-    r = _git("push", "origin", "main")
+    # Push the checked-out branch (main or master) in one call
+    r = _git("push", "origin", "HEAD")
     if r.returncode != 0:
-        # Try 'master' branch as fallback
-        r = _git("push", "origin", "master")
-        if r.returncode != 0:
-            print(f"⚠ Git push failed: {r.stderr.strip()}")
-            return False
+        print(f"⚠ Git push failed: {r.stderr.strip()}")
+        return False
     print("✓ Pushed to GitHub Pages")
     return True
 
@@ -667,10 +1212,10 @@ def publish_briefing(site_dir=None, push=True):
         return False
 
     print(f"Publishing to {site_dir}")
-    generate_site(site_dir, incremental=True)
+    written = generate_site(site_dir, incremental=True)
 
     if push:
-        return git_publish(site_dir)
+        return git_publish(site_dir, written)
     return True
 
 
@@ -679,6 +1224,8 @@ def publish_briefing(site_dir=None, push=True):
 # =============================================================================
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Generate and publish H3lPeR static site")
     parser.add_argument(
         "--site-dir",
@@ -695,6 +1242,11 @@ def main():
         action="store_true",
         help="Regenerate all briefing pages (disable incremental mode)",
     )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Also write pre-compressed .html.gz files (not used by GitHub Pages)",
+    )
     args = parser.parse_args()
 
     if not args.site_dir:
@@ -702,10 +1254,10 @@ def main():
         sys.exit(1)
 
     print(f"Publishing to {args.site_dir}")
-    generate_site(args.site_dir, incremental=not args.full)
+    written = generate_site(args.site_dir, incremental=not args.full, precompress=args.gzip)
 
     if not args.no_push:
-        if not git_publish(args.site_dir):
+        if not git_publish(args.site_dir, written):
             sys.exit(1)
 
     print("Done.")
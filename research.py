@@ -1,9 +1,13 @@
-import feeds
-from copilot import Copilot
-import json
-import re
+import hashlib
+import threading
 import time
 import os
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from copilot import extract_json
+from datamodel import unique_articles
 
 try:
     from arxiv_citations import ArxivCitationAnalyzer
@@ -14,6 +18,94 @@ except ImportError:
 
 ARXIV_RSS_BASE = "https://export.arxiv.org/rss/"
 
+# Upper bound on in-flight LLM calls, shared by every ranker, research batch
+# and the research clusterer (see _llm_executor)
+LLM_CONCURRENCY = 4
+
+# Upper bound on research batches fetched and ranked at the same time
+RESEARCH_BATCH_CONCURRENCY = 4
+
+# Ranking batch sizing: start at the historical 20 articles per prompt and
+# adapt to observed LLM latency, but never past what the context budget holds
+DEFAULT_BATCH_SIZE = 20
+MIN_BATCH_SIZE = 10
+TARGET_INPUT_TOKENS = 12000
+BASE_PROMPT_TOKENS = 300
+PER_ARTICLE_TOKENS = 100
+MAX_BATCH_SIZE = (TARGET_INPUT_TOKENS - BASE_PROMPT_TOKENS) // PER_ARTICLE_TOKENS
+
+# Ranking responses kept for identical prompts (e.g. re-ranking the same
+# survivors when a comparison is refreshed); least recently used evicted first
+RESPONSE_CACHE_SIZE = 256
+
+
+# Selection rubrics, shared by the single-criterion rankers and DualRanker
+RELEVANCE_CRITERIA = """- Distributed systems and large-scale computing
+- AI/ML infrastructure and training at scale
+- Computer architecture and hardware design
+- Performance optimization and systems research"""
+
+NOVELTY_CRITERIA = """- Breakthrough methodologies or surprising results
+- Papers that could change how we think about a problem
+- Practical applications with real-world potential
+- Research that bridges theory and industry
+
+Ignore incremental improvements. Prioritize bold, innovative ideas."""
+
+# Criterion key -> (what to select for, rubric). Single-criterion rankers
+# use one entry; DualRanker asks for every entry in one prompt.
+RANKING_CRITERIA = {
+    "relevance": ("most relevant to", RELEVANCE_CRITERIA),
+    "novelty": ("with the highest NOVELTY and POTENTIAL IMPACT", NOVELTY_CRITERIA),
+}
+
+# Structured-output schemas for the ranking responses
+_INDEX_LIST_SCHEMA = {"type": "array", "items": {"type": "integer"}}
+
+PICKS_SCHEMA = {
+    "type": "object",
+    "properties": {"picks": _INDEX_LIST_SCHEMA},
+    "required": ["picks"],
+}
+
+DUAL_PICKS_SCHEMA = {
+    "type": "object",
+    "properties": {key: _INDEX_LIST_SCHEMA for key in RANKING_CRITERIA},
+    "required": list(RANKING_CRITERIA),
+}
+
+# Ranking prompts. The instructions are constant per criterion and go in the
+# system message, so every call shares a cacheable prefix; the user message
+# carries only what varies: n (batch size), k (picks) and body (article blurbs).
+_SYSTEM_HEADER = "You review batches of research articles from arXiv, given as numbered entries.\n"
+
+SYSTEM_PROMPTS = {
+    key: (
+        _SYSTEM_HEADER
+        + f"Select the papers {goal}:\n{rubric}\n\n"
+        + 'Respond with ONLY a JSON object of the form {"picks": [3, 7, 12, 1, 18]}\n'
+        "with the requested number of indices. No explanation, just the JSON object."
+    )
+    for key, (goal, rubric) in RANKING_CRITERIA.items()
+}
+
+DUAL_SYSTEM_PROMPT = (
+    _SYSTEM_HEADER
+    + "Make two independent selections.\n\n"
+    + "\n\n".join(
+        f"{key.upper()}: select the papers {goal}:\n{rubric}"
+        for key, (goal, rubric) in RANKING_CRITERIA.items()
+    )
+    + '\n\nRespond with ONLY a JSON object of the form {"relevance": [3, 7, 12, 1, 18], "novelty": [4, 7, 0, 9, 2]}\n'
+    "with the requested number of indices in each list. No explanation, just the JSON object."
+)
+
+USER_PROMPT_TEMPLATE = "Select the TOP {k} of these {n} articles.\n\nArticles to review:\n{body}"
+
+DUAL_USER_PROMPT_TEMPLATE = (
+    "Select the TOP {k} by each criterion from these {n} articles.\n\nArticles to review:\n{body}"
+)
+
 DEFAULT_BATCHES = [
     {
         "name": "Research",
@@ -80,82 +172,193 @@ def _load_research_config():
     ]
 
 
+def _prompt_body(articles):
+    """Numbered article blurbs for a ranking prompt, one blank line apart."""
+    return "\n\n".join(f"[{i}] {a.rank_fragment}" for i, a in enumerate(articles))
+
+
+def _estimate_tokens(text):
+    """Rough token count (~4 characters per token)."""
+    return len(text) // 4
+
+
+def _pack_batches(articles, max_articles):
+    """Split articles into consecutive prompt batches.
+
+    A batch closes when it reaches max_articles or when its blurbs would push
+    the prompt past TARGET_INPUT_TOKENS, whichever comes first.
+    """
+    budget = TARGET_INPUT_TOKENS - BASE_PROMPT_TOKENS
+    batches = []
+    batch = []
+    used = 0
+    for article in articles:
+        # "[i] " prefix and blank-line separator included
+        cost = _estimate_tokens(article.rank_fragment) + 3
+        if batch and (len(batch) >= max_articles or used + cost > budget):
+            batches.append(batch)
+            batch = []
+            used = 0
+        batch.append(article)
+        used += cost
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+def _response_key(llm, system, prompt):
+    """Cache key for one ranking call: model plus a digest of both messages."""
+    digest = hashlib.blake2b(f"{system}\0{prompt}".encode(), digest_size=16).hexdigest()
+    return getattr(llm, "model", None), digest
+
+
+def _cached_response(key):
+    with _response_cache_lock:
+        response = _response_cache.get(key)
+        if response is not None:
+            _response_cache.move_to_end(key)
+        return response
+
+
+def _cache_response(key, response):
+    with _response_cache_lock:
+        _response_cache[key] = response
+        _response_cache.move_to_end(key)
+        while len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def _default_llm():
+    """Shared Copilot client, so standalone rankers reuse one connection pool."""
+    from copilot import Copilot
+    return Copilot()
+
+
+@lru_cache(maxsize=1)
+def _llm_executor():
+    """Pool every ranking and clustering call runs on, so research batches
+    ranked in parallel still keep at most LLM_CONCURRENCY calls in flight."""
+    return ThreadPoolExecutor(max_workers=LLM_CONCURRENCY)
+
+
+class BatchSizeSuggester:
+    """
+    Suggests a ranking batch size from recent LLM round latencies.
+    Grows the batch while rounds finish under min_duration (fewer rounds and
+    calls) and shrinks it when they exceed max_duration (fewer timeouts).
+    """
+
+    def __init__(self, initial=DEFAULT_BATCH_SIZE, min_size=MIN_BATCH_SIZE, max_size=MAX_BATCH_SIZE,
+                 min_duration=8.0, max_duration=30.0, step_ratio=0.25, window=5):
+        self.size = initial
+        self.min_size = min_size
+        self.max_size = max_size
+        self.min_duration = min_duration
+        self.max_duration = max_duration
+        self.step_ratio = step_ratio
+        self._durations = deque(maxlen=window)
+        # Research batches ranked in parallel share one ranker and its sizer
+        self._lock = threading.Lock()
+
+    def observe(self, duration, batch_len):
+        """Record one round's wall time for batches of batch_len articles"""
+        with self._lock:
+            # Only rounds run at the current size say anything about it
+            if batch_len >= self.size:
+                self._durations.append(duration)
+
+    def suggest(self):
+        with self._lock:
+            if self._durations:
+                average = sum(self._durations) / len(self._durations)
+                if average < self.min_duration:
+                    size = int(self.size * (1 + self.step_ratio))
+                elif average > self.max_duration:
+                    size = int(self.size * (1 - self.step_ratio))
+                else:
+                    size = self.size
+                size = max(self.min_size, min(self.max_size, size))
+                if size != self.size:
+                    self.size = size
+                    self._durations.clear()
+            return self.size
+
+
 class ResearchRanker:
     """
     Base class for research paper ranking strategies.
     Each ranker implements a different approach to selecting top papers.
     """
     
+    # Key into RANKING_CRITERIA for single-criterion rankers
+    criterion = None
+    # Structured-output schema the responses are requested in
+    response_schema = PICKS_SCHEMA
+
     def __init__(self, name, description, llm=None):
         self.name = name
         self.description = description
-        self.llm = llm or Copilot()
+        self.llm = llm or _default_llm()
+        self.batch_sizer = BatchSizeSuggester()
     
-    def rank(self, articles, target=5):
-        """Rank and select top articles. Override in subclasses."""
-        raise NotImplementedError
+    def _system_prompt(self):
+        """Constant ranking instructions for self.criterion"""
+        return SYSTEM_PROMPTS[self.criterion]
+
+    def _build_prompt(self, articles, top_k):
+        """User message asking for the top_k of articles"""
+        return USER_PROMPT_TEMPLATE.format(
+            n=len(articles), k=top_k, body=_prompt_body(articles)
+        )
 
+    @staticmethod
+    def _picked(indices, articles, top_k):
+        """Articles at the valid indices, in order, at most top_k"""
+        if not isinstance(indices, list):
+            return []
+        return [articles[i] for i in indices if isinstance(i, int) and 0 <= i < len(articles)][:top_k]
+
+    def _parse_indices(self, response, articles, top_k):
+        """(articles named by the "picks" list in response, True); (first top_k, False) on failure."""
+        selected = extract_json(response)
+        if isinstance(selected, dict):
+            selected = selected.get("picks")
+        picked = self._picked(selected, articles, top_k)
+        if picked:
+            return picked, True
+        print(f"{type(self).__name__} parse error: no picks in {response[:80]!r}")
+        return articles[:top_k], False
+
+    def _unranked(self, articles, top_k):
+        """Result for a batch small enough to keep without asking the LLM"""
+        return articles
+
+    def _parse_response(self, response, articles, top_k):
+        """(selection, usable); usable is False when a fallback was substituted"""
+        return self._parse_indices(response, articles, top_k)
 
-class RelevanceRanker(ResearchRanker):
-    """
-    Ranks papers based on relevance to specific technical domains.
-    Focuses on: distributed systems, performance, AI infrastructure, hardware.
-    """
-    
-    def __init__(self, llm=None):
-        super().__init__(
-            name="🎯 Relevance Ranker",
-            description="Prioritizes papers relevant to infrastructure, distributed systems, and AI hardware",
-            llm=llm
-        )
-    
     def _rank_batch(self, articles, top_k=5):
-        """Rank a batch of articles by relevance"""
-        if len(articles) <= top_k:
-            return articles
-        
-        article_list = []
-        for i, article in enumerate(articles):
-            article_list.append(
-                f"[{i}] {article.title}\n"
-                f"Summary: {article.summary[:200]}...\n"
-                f"URL: {article.url}"
-            )
-        
-        prompt = f"""You are reviewing {len(articles)} research articles from arXiv.
-Select the TOP {top_k} papers most relevant to:
-- Distributed systems and large-scale computing
-- AI/ML infrastructure and training at scale
-- Computer architecture and hardware design
-- Performance optimization and systems research
+        """Rank a batch of articles with one LLM call"""
+        return self._rank_batches([articles], top_k=top_k)[0]
 
-Articles to review:
-{''.join(article_list)}
+    def rank(self, articles, target=5, batch_size=None):
+        """Reduce articles through batched ranking.
 
-Respond with ONLY a JSON array of the {top_k} indices (e.g., [3, 7, 12, 1, 18]).
-No explanation, just the JSON array."""
-        
-        response = self.llm.generate(prompt)
-        
-        try:
-            match = re.search(r'\[[\d,\s]+\]', response)
-            if match:
-                selected_indices = json.loads(match.group())
-                return [articles[i] for i in selected_indices if i < len(articles)][:top_k]
-        except Exception as e:
-            print(f"RelevanceRanker parse error: {e}")
-        
-        return articles[:top_k]
-    
-    def rank(self, articles, target=5, batch_size=20):
-        """Reduce articles through batched relevance ranking"""
-        current = articles[:]
+        batch_size: most articles per prompt (prompts are also capped at
+            TARGET_INPUT_TOKENS); None lets self.batch_sizer pick it
+        """
+        current = articles
         
-        while len(current) > target:
-            batches = [current[i:i+batch_size] for i in range(0, len(current), batch_size)]
+        # Multi-batch rounds until one prompt can hold the whole pool
+        while not self._fits_one_prompt(current, batch_size):
+            batches = _pack_batches(current, batch_size or self.batch_sizer.suggest())
             reduced = []
-            for batch in batches:
-                top = self._rank_batch(batch, top_k=min(5, len(batch)))
+            for top in self._run_round(batches, top_k=5):
                 reduced.extend(top)
             
             if len(reduced) >= len(current):
@@ -167,6 +370,78 @@ No explanation, just the JSON array."""
         
         return current[:target]
 
+    @staticmethod
+    def _fits_one_prompt(articles, batch_size=None):
+        """Whether articles fit a single ranking prompt.
+
+        Judged against the full token budget rather than the batch sizer's
+        suggestion: a pool that fits is finished with one call instead of
+        another reduction round plus a final call.
+        """
+        return len(_pack_batches(articles, batch_size or MAX_BATCH_SIZE)) <= 1
+
+    def _run_round(self, batches, top_k=5):
+        """_rank_batches, timed for the batch sizer"""
+        start = time.monotonic()
+        results = self._rank_batches(batches, top_k=top_k)
+        self.batch_sizer.observe(time.monotonic() - start, max(len(batch) for batch in batches))
+        return results
+
+    def _rank_batches(self, batches, top_k=5):
+        """Rank independent batches, submitting all of their prompts at once.
+
+        The calls of a round run concurrently on the shared LLM executor, so
+        a round costs roughly one call's latency instead of the sum.
+        Results are returned in batch order.
+        """
+        results = [self._unranked(batch, top_k) if len(batch) <= top_k else None
+                   for batch in batches]
+        todo = [i for i, result in enumerate(results) if result is None]
+        responses, fresh_keys = self._generate_all([self._build_prompt(batches[i], top_k) for i in todo])
+        for i, response, key in zip(todo, responses, fresh_keys):
+            results[i], usable = self._parse_response(response, batches[i], top_k)
+            # Cache only responses that parsed, so a bad one is not replayed
+            if usable and key is not None:
+                _cache_response(key, response)
+        return results
+
+    def _generate_all(self, prompts):
+        """One LLM response per prompt, in order; repeated prompts are served from cache.
+
+        Returns:
+            (responses, fresh_keys): fresh_keys holds the cache key of each
+            newly generated response and None for responses taken from cache
+        """
+        options = {"system": self._system_prompt(), "json_schema": self.response_schema}
+        keys = [_response_key(self.llm, options["system"], prompt) for prompt in prompts]
+        responses = [_cached_response(key) for key in keys]
+        fresh_keys = [None] * len(prompts)
+        todo = [i for i, response in enumerate(responses) if response is None]
+        pending = [prompts[i] for i in todo]
+        # One executor for all rankers: per-call generate_batch pools would
+        # multiply with RESEARCH_BATCH_CONCURRENCY
+        fresh = _llm_executor().map(lambda prompt: self.llm.generate(prompt, **options), pending)
+        for i, response in zip(todo, fresh):
+            responses[i] = response
+            fresh_keys[i] = keys[i]
+        return responses, fresh_keys
+
+
+class RelevanceRanker(ResearchRanker):
+    """
+    Ranks papers based on relevance to specific technical domains.
+    Focuses on: distributed systems, performance, AI infrastructure, hardware.
+    """
+    
+    criterion = "relevance"
+
+    def __init__(self, llm=None):
+        super().__init__(
+            name="🎯 Relevance Ranker",
+            description="Prioritizes papers relevant to infrastructure, distributed systems, and AI hardware",
+            llm=llm
+        )
+
 
 class NoveltyImpactRanker(ResearchRanker):
     """
@@ -174,72 +449,84 @@ class NoveltyImpactRanker(ResearchRanker):
     Focuses on: breakthrough ideas, practical applications, industry relevance.
     """
     
+    criterion = "novelty"
+
     def __init__(self, llm=None):
         super().__init__(
             name="💡 Novelty & Impact Ranker",
             description="Prioritizes breakthrough ideas with potential real-world impact",
             llm=llm
         )
-    
-    def _rank_batch(self, articles, top_k=5):
-        """Rank a batch of articles by novelty and impact"""
-        if len(articles) <= top_k:
-            return articles
-        
-        article_list = []
-        for i, article in enumerate(articles):
-            article_list.append(
-                f"[{i}] {article.title}\n"
-                f"Summary: {article.summary[:200]}...\n"
-                f"URL: {article.url}"
-            )
-        
-        prompt = f"""You are reviewing {len(articles)} research articles from arXiv.
-Select the TOP {top_k} papers with the highest NOVELTY and POTENTIAL IMPACT:
-- Breakthrough methodologies or surprising results
-- Papers that could change how we think about a problem
-- Practical applications with real-world potential
-- Research that bridges theory and industry
 
-Ignore incremental improvements. Prioritize bold, innovative ideas.
 
-Articles to review:
-{''.join(article_list)}
+class DualRanker(ResearchRanker):
+    """
+    Applies the relevance and novelty/impact rubrics in one LLM call per batch.
+    Approximates running RelevanceRanker and NoveltyImpactRanker separately
+    with half the calls and tokens; since reduction rounds keep the union of
+    both rubrics' picks, the selections can differ from two independent runs.
+    """
 
-Respond with ONLY a JSON array of the {top_k} indices (e.g., [3, 7, 12, 1, 18]).
-No explanation, just the JSON array."""
-        
-        response = self.llm.generate(prompt)
-        
-        try:
-            match = re.search(r'\[[\d,\s]+\]', response)
-            if match:
-                selected_indices = json.loads(match.group())
-                return [articles[i] for i in selected_indices if i < len(articles)][:top_k]
-        except Exception as e:
-            print(f"NoveltyImpactRanker parse error: {e}")
-        
-        return articles[:top_k]
-    
-    def rank(self, articles, target=5, batch_size=20):
-        """Reduce articles through batched novelty/impact ranking"""
-        current = articles[:]
-        
-        while len(current) > target:
-            batches = [current[i:i+batch_size] for i in range(0, len(current), batch_size)]
+    response_schema = DUAL_PICKS_SCHEMA
+
+    def __init__(self, llm=None):
+        super().__init__(
+            name="🤝 Dual Ranker",
+            description="Selects by relevance and by novelty/impact in a single pass",
+            llm=llm
+        )
+
+    def _system_prompt(self):
+        return DUAL_SYSTEM_PROMPT
+
+    def _build_prompt(self, articles, top_k):
+        return DUAL_USER_PROMPT_TEMPLATE.format(
+            n=len(articles), k=top_k, body=_prompt_body(articles)
+        )
+
+    def _unranked(self, articles, top_k):
+        return articles, articles
+
+    def _parse_response(self, response, articles, top_k):
+        """Parse both selections; returns ((relevance_picks, novelty_picks), usable)"""
+        selected = extract_json(response)
+        if not isinstance(selected, dict):
+            print(f"DualRanker parse error: no JSON object in {response[:80]!r}")
+            selected = {}
+        picks = [self._picked(selected.get(key), articles, top_k) for key in RANKING_CRITERIA]
+        return tuple(p or articles[:top_k] for p in picks), all(picks)
+
+    def rank(self, articles, target=5, batch_size=None):
+        """Reduce articles by both rubrics at once.
+
+        Each round keeps the union of both rubrics' picks, so a paper stays
+        in the pool while either rubric still wants it. Per-rubric picks are
+        capped below half a batch so the union always shrinks the pool. One
+        final call over the remaining pool yields the two selections.
+
+        Returns:
+            (relevance_picks, novelty_picks)
+        """
+        pool = articles
+
+        while not self._fits_one_prompt(pool, batch_size):
+            batches = _pack_batches(pool, batch_size or self.batch_sizer.suggest())
+            # Up to 2 * top_k papers survive a batch; keep that under its size
+            top_k = max(1, min(5, (len(batches[0]) - 1) // 2))
             reduced = []
-            for batch in batches:
-                top = self._rank_batch(batch, top_k=min(5, len(batch)))
-                reduced.extend(top)
-            
-            if len(reduced) >= len(current):
+            seen = set()
+            for relevance, novelty in self._run_round(batches, top_k=top_k):
+                for a in relevance + novelty:
+                    if a.url not in seen:
+                        seen.add(a.url)
+                        reduced.append(a)
+
+            if len(reduced) >= len(pool):
                 break
-            current = reduced
-        
-        if len(current) > target:
-            current = self._rank_batch(current, top_k=target)
-        
-        return current[:target]
+            pool = reduced
+
+        relevance, novelty = self._rank_batch(pool, top_k=target)
+        return relevance[:target], novelty[:target]
 
 
 class CitationRanker(ResearchRanker):
@@ -376,7 +663,7 @@ class Research:
     
     def __init__(self, use_dual_ranker=True, use_citation_ranker=False, semantic_scholar_api_key=None):
         self.articles = []
-        self.llm = Copilot()
+        self.llm = _default_llm()
         self.use_dual_ranker = use_dual_ranker
         self.use_citation_ranker = use_citation_ranker
         self.batches = _load_research_config()
@@ -388,8 +675,17 @@ class Research:
         # Initialize rankers
         self.relevance_ranker = RelevanceRanker(llm=self.llm)
         self.novelty_ranker = NoveltyImpactRanker(llm=self.llm)
+        self.dual_ranker = DualRanker(llm=self.llm)
         self.citation_ranker = CitationRanker(api_key=semantic_scholar_api_key) if use_citation_ranker else None
 
+        # Dual-ranker picks from the last pull, keyed by the URL set of self.articles
+        self._last_picks = {"relevance": None, "novelty": None, "key": None}
+
+    @staticmethod
+    def _articles_key(articles):
+        # The URL set itself, not its hash(): equal keys mean equal pools
+        return frozenset(a.url for a in articles)
+
     def section_title(self):
         return "Arxiv Review"
 
@@ -397,7 +693,7 @@ class Research:
         """Legacy method - use RelevanceRanker for backward compatibility"""
         return self.relevance_ranker._rank_batch(articles, top_k=5)
 
-    def _reduce_articles(self, articles, target=5, batch_size=20):
+    def _reduce_articles(self, articles, target=5, batch_size=None):
         """Legacy method - use RelevanceRanker for backward compatibility"""
         return self.relevance_ranker.rank(articles, target=target, batch_size=batch_size)
 
@@ -408,7 +704,11 @@ class Research:
             print(f"  Warning: batch '{batch.get('name', '?')}' has no URL, skipping")
             return []
         print(f"  Fetching research articles from {url} ...")
-        return feeds.Feeds.get_articles(url, days=days)
+        import feeds
+
+        # Cross-listed papers show up once per category in the combined feed,
+        # and revised papers may reappear under a new version suffix
+        return unique_articles(feeds.Feeds.get_articles(url, days=days))
 
     def pull_data(self, compare_rankers=None):
         """
@@ -424,52 +724,83 @@ class Research:
         if compare_rankers is None:
             compare_rankers = self.use_dual_ranker
 
+        # Batches are independent (own feed, own ranking), so fetch and rank
+        # them side by side; results are still assembled in config order.
+        if len(self.batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(RESEARCH_BATCH_CONCURRENCY, len(self.batches))) as executor:
+                results = list(executor.map(lambda b: self._pull_batch(b, compare_rankers), self.batches))
+        else:
+            results = [self._pull_batch(batch, compare_rankers) for batch in self.batches]
+
         all_output = []
         all_articles = []
+        all_relevance = []
+        all_novelty = []
 
-        for batch in self.batches:
-            batch_name = batch['name']
-            max_papers = batch.get('max_papers', 5)
-
-            # Use a wider window than 24h so we still get content on quieter days.
-            articles = self._fetch_batch_articles(batch, days=3)
-            if not articles:
-                print(f"  No articles found for batch '{batch_name}'")
+        for batch, result in zip(self.batches, results):
+            if result is None:
                 continue
-
-            print(f"  Batch '{batch_name}': {len(articles)} articles fetched")
-
-            if not compare_rankers:
-                # Single ranker mode
-                ranked = self._reduce_articles(articles, target=max_papers, batch_size=50)
-                batch_output = "\n\n".join([xx.out_rich() for xx in ranked])
-                all_articles.extend(ranked)
-            else:
-                # Dual ranker comparison mode
-                print(f"  Running dual ranker comparison on {len(articles)} articles...")
-                ranked, batch_output = self._dual_rank_format(articles, max_papers)
-                all_articles.extend(ranked)
+            ranked, batch_output, relevance_picks, novelty_picks = result
+            all_articles.extend(ranked)
+            all_relevance.extend(relevance_picks)
+            all_novelty.extend(novelty_picks)
 
             if len(self.batches) > 1:
-                all_output.append(f"## {batch_name}\n\n{batch_output}")
+                all_output.append(f"## {batch['name']}\n\n{batch_output}")
             else:
                 all_output.append(batch_output)
 
         self.articles = all_articles
+        if compare_rankers:
+            self._last_picks = {
+                "relevance": all_relevance,
+                "novelty": all_novelty,
+                "key": self._articles_key(all_articles),
+            }
         return "\n\n".join(all_output)
 
+    def _pull_batch(self, batch, compare_rankers):
+        """Fetch and rank one research batch.
+
+        Returns:
+            (ranked, formatted_output, relevance_picks, novelty_picks), or
+            None if the feed had no articles
+        """
+        batch_name = batch['name']
+        max_papers = batch.get('max_papers', 5)
+
+        # Use a wider window than 24h so we still get content on quieter days.
+        articles = self._fetch_batch_articles(batch, days=3)
+        if not articles:
+            print(f"  No articles found for batch '{batch_name}'")
+            return None
+
+        print(f"  Batch '{batch_name}': {len(articles)} articles fetched")
+
+        if not compare_rankers:
+            # Single ranker mode
+            ranked = self._reduce_articles(articles, target=max_papers, batch_size=50)
+            return ranked, "\n\n".join([xx.out_rich() for xx in ranked]), [], []
+
+        # Dual ranker comparison mode
+        print(f"  Running dual ranker comparison on {len(articles)} articles...")
+        return self._dual_rank_format(articles, max_papers)
+
     def _dual_rank_format(self, articles, target=5):
-        """Run dual ranker comparison and return (articles, formatted_output)."""
-        print(f"    Running {self.relevance_ranker.name}...")
-        relevance_picks = self.relevance_ranker.rank(articles[:], target=target)
+        """Run dual ranker comparison.
 
-        print(f"    Running {self.novelty_ranker.name}...")
-        novelty_picks = self.novelty_ranker.rank(articles[:], target=target)
+        Returns:
+            (articles, formatted_output, relevance_picks, novelty_picks)
+        """
+        print(f"    Running {self.relevance_ranker.name} + {self.novelty_ranker.name}...")
+        relevance_picks, novelty_picks = self.dual_ranker.rank(articles, target=target)
 
         # Find common picks
         relevance_urls = {a.url for a in relevance_picks}
         novelty_urls = {a.url for a in novelty_picks}
         common_urls = relevance_urls & novelty_urls
+        relevance_only_urls = relevance_urls - novelty_urls
+        novelty_only_urls = novelty_urls - relevance_urls
 
         output = []
 
@@ -480,7 +811,7 @@ class Research:
                 output.append(f"  - {article.summary[:150]}...<br>\n")
             output.append("")
 
-        relevance_only = [a for a in relevance_picks if a.url not in common_urls]
+        relevance_only = [a for a in relevance_picks if a.url in relevance_only_urls]
         if relevance_only:
             output.append(f"### {self.relevance_ranker.name} Also Picks:\n")
             output.append(f"*{self.relevance_ranker.description}*\n")
@@ -488,7 +819,7 @@ class Research:
                 output.append(f"- **[{article.title}]({article.url})**<br>\n")
             output.append("")
 
-        novelty_only = [a for a in novelty_picks if a.url not in common_urls]
+        novelty_only = [a for a in novelty_picks if a.url in novelty_only_urls]
         if novelty_only:
             output.append(f"### {self.novelty_ranker.name} Also Picks:\n")
             output.append(f"*{self.novelty_ranker.description}*\n")
@@ -496,21 +827,23 @@ class Research:
                 output.append(f"- **[{article.title}]({article.url})**<br>\n")
             output.append("")
 
-        # Deduplicate
-        seen = set()
-        unique = []
-        for a in relevance_picks + novelty_picks:
+        # Deduplicate: every relevance pick is kept, then the novelty-only ones
+        unique = list({a.url: a for a in relevance_picks}.values())
+        seen = set(relevance_urls)
+        for a in novelty_picks:
             if a.url not in seen:
                 seen.add(a.url)
                 unique.append(a)
 
-        return unique, "\n".join(output)
+        return unique, "\n".join(output), relevance_picks, novelty_picks
 
     def pull_data_raw(self):
         """Pull raw article data from all configured batches for external processing"""
-        self.articles = []
+        articles = []
         for batch in self.batches:
-            self.articles.extend(self._fetch_batch_articles(batch, days=3))
+            articles.extend(self._fetch_batch_articles(batch, days=3))
+        # Batches with overlapping categories return the same papers
+        self.articles = unique_articles(articles)
         return self.articles
     
     def pull_data_with_citations(self, days=1, top_n=5, min_citations=2):
@@ -563,13 +896,22 @@ class Research:
         
         return "\n".join(output)
 
-    def get_ranker_comparison_summary(self):
-        """Get a summary comparing the two rankers' selections"""
+    def get_ranker_comparison_summary(self, force_refresh=False):
+        """Get a summary comparing the two rankers' selections.
+
+        Reuses the picks from the last dual-ranker pull_data() when they match
+        self.articles; force_refresh=True re-ranks regardless.
+        """
         if not self.articles:
             self.pull_data(compare_rankers=True)
         
-        relevance_picks = self.relevance_ranker.rank(self.articles[:], target=5)
-        novelty_picks = self.novelty_ranker.rank(self.articles[:], target=5)
+        key = self._articles_key(self.articles)
+        if not force_refresh and self._last_picks["key"] == key:
+            relevance_picks = self._last_picks["relevance"]
+            novelty_picks = self._last_picks["novelty"]
+        else:
+            relevance_picks, novelty_picks = self.dual_ranker.rank(self.articles, target=5)
+            self._last_picks = {"relevance": relevance_picks, "novelty": novelty_picks, "key": key}
         
         relevance_urls = {a.url for a in relevance_picks}
         novelty_urls = {a.url for a in novelty_picks}
@@ -580,7 +922,7 @@ class Research:
             'relevance_count': len(relevance_picks),
             'novelty_count': len(novelty_picks),
             'agreement_count': agreement,
-            'agreement_pct': agreement / 5 * 100 if len(relevance_picks) else 0
+            'agreement_pct': agreement / len(relevance_picks) * 100 if len(relevance_picks) else 0
         }
 
 
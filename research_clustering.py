@@ -9,24 +9,31 @@ selects a single representative article per cluster via LLM.
 
 from __future__ import annotations
 
-import json
-import re
 from collections import defaultdict
 from typing import List, Optional
 
 import numpy as np
 from sklearn.cluster import AgglomerativeClustering
-from sklearn.metrics.pairwise import cosine_distances
 
-from copilot import Copilot
-from datamodel import Article, Group
+from copilot import Copilot, extract_json
+from datamodel import Article, Group, unique_articles
+from research import PICKS_SCHEMA, _llm_executor
+
+# Structured-output schema for the representative prompt (ranking reuses
+# research.PICKS_SCHEMA)
+PICK_SCHEMA = {
+    "type": "object",
+    "properties": {"pick": {"type": "integer"}},
+    "required": ["pick"],
+}
 
 
 class ResearchClusterer:
     """Cluster research papers using vector embeddings.
 
     Pipeline:
-      1. Embed articles via Azure OpenAI (batches of 20)
+      1. Embed articles via Azure OpenAI (batches of 20), reusing cached
+         vectors for URLs seen in earlier runs
       2. Agglomerative clustering with cosine distance
       3. Rank clusters by importance via LLM
       4. Select one representative article per cluster via LLM
@@ -37,17 +44,57 @@ class ResearchClusterer:
         llm: Optional[Copilot] = None,
         distance_threshold: float = 0.15,
         embed_batch_size: int = 20,
+        use_cache: bool = True,
     ):
         self.llm = llm or Copilot()
         self.distance_threshold = distance_threshold
         self.embed_batch_size = embed_batch_size
 
+        self.embed_cache = None
+        if use_cache:
+            try:
+                from embedding_cache import EmbeddingCache
+                self.embed_cache = EmbeddingCache()
+            except Exception as e:
+                print(f"Warning: Could not initialize embedding cache: {e}")
+
     def _article_text(self, article: Article) -> str:
         """Build the text representation used for embedding."""
         title = (article.title or "").strip()
         summary = (article.summary or "").strip()[:500]
         return f"{title}. {summary}" if summary else title
 
+    def _embed(self, articles: List[Article]) -> List[List[float]]:
+        """Embedding per article; only URLs missing from the cache hit the API."""
+        # Vectors from different models are not comparable, so key by model
+        model = getattr(self.llm, "embedding_model", None) or "default"
+        cached = {}
+        if self.embed_cache is not None:
+            try:
+                cached = self.embed_cache.get_many(model, [a.url for a in articles if a.url])
+            except Exception as e:
+                print(f"Warning: embedding cache lookup failed: {e}")
+
+        vectors = [cached.get(a.url) for a in articles]
+        missing = [i for i, vec in enumerate(vectors) if vec is None]
+        if missing:
+            fresh = self.llm.embed(
+                [self._article_text(articles[i]) for i in missing],
+                batch_size=self.embed_batch_size,
+            )
+            for i, vec in zip(missing, fresh):
+                vectors[i] = vec
+            if self.embed_cache is not None:
+                try:
+                    self.embed_cache.put_many(
+                        model, [(articles[i].url, vectors[i]) for i in missing if articles[i].url]
+                    )
+                except Exception as e:
+                    print(f"Warning: embedding cache update failed: {e}")
+        if cached:
+            print(f"ResearchClusterer: {len(articles) - len(missing)} embeddings from cache")
+        return vectors
+
     def embed_and_cluster(self, articles: List[Article]) -> List[Group]:
         """Embed articles and cluster them by cosine similarity.
 
@@ -58,18 +105,20 @@ class ResearchClusterer:
             return []
 
         # 1. Embed
-        texts = [self._article_text(a) for a in articles]
-        vectors = self.llm.embed(texts, batch_size=self.embed_batch_size)
-        for article, vec in zip(articles, vectors):
-            article.vector = vec
-
-        X = np.array(vectors)
+        # float32 halves the matrix footprint and is ample for cosine distances
+        X = np.asarray(self._embed(articles), dtype=np.float32)
+        for article, row in zip(articles, X):
+            article.vector = row
 
         # 2. Cluster (single-article input is a special case)
         if len(articles) == 1:
             return [Group(text=articles[0].title, articles=[articles[0]])]
 
-        dist_matrix = cosine_distances(X)
+        # Cosine distance as one matrix product over unit-length rows
+        X = X / (np.linalg.norm(X, axis=1, keepdims=True) + 1e-12)
+        dist_matrix = 1.0 - X @ X.T
+        np.clip(dist_matrix, 0.0, 2.0, out=dist_matrix)
+        np.fill_diagonal(dist_matrix, 0.0)
 
         clustering = AgglomerativeClustering(
             n_clusters=None,
@@ -117,18 +166,19 @@ Consider: novelty, potential impact, breadth of interest, and practical relevanc
 Clusters:
 {items}
 
-Respond with ONLY a JSON array of the {top_k} cluster indices (e.g., [2, 0, 5, 1, 3]).
-No explanation, just the JSON array."""
+Respond with ONLY a JSON object of the {top_k} cluster indices (e.g., {{"picks": [2, 0, 5, 1, 3]}}).
+No explanation, just the JSON object."""
 
-        response = self.llm.generate(prompt)
+        response = self.llm.generate(prompt, json_schema=PICKS_SCHEMA)
 
-        try:
-            match = re.search(r"\[[\d,\s]+\]", response)
-            if match:
-                selected = json.loads(match.group())
-                return [groups[i] for i in selected if i < len(groups)][:top_k]
-        except Exception as e:
-            print(f"ResearchClusterer.rank_clusters parse error: {e}")
+        selected = extract_json(response)
+        if isinstance(selected, dict):
+            selected = selected.get("picks")
+        if isinstance(selected, list):
+            picked = [groups[i] for i in selected if isinstance(i, int) and 0 <= i < len(groups)][:top_k]
+            if picked:
+                return picked
+        print(f"ResearchClusterer.rank_clusters parse error: no picks in {response[:80]!r}")
 
         return groups[:top_k]
 
@@ -136,48 +186,50 @@ No explanation, just the JSON array."""
         """Select a single representative article from each cluster.
 
         For single-article clusters, returns the article directly.
-        For multi-article clusters, asks the LLM to pick the best one.
+        For multi-article clusters, asks the LLM to pick the best one;
+        those prompts are independent, so they are submitted together.
         """
-        representatives: List[Article] = []
+        groups = [g for g in groups if g.articles]
+        contested = [g for g in groups if len(g.articles) > 1]
+        responses = self._generate_all([self._representative_prompt(g) for g in contested], PICK_SCHEMA)
+        picks = {id(g): self._parse_representative(g, r) for g, r in zip(contested, responses)}
 
-        for group in groups:
-            if not group.articles:
-                continue
-            if len(group.articles) == 1:
-                representatives.append(group.articles[0])
-                continue
+        return [picks.get(id(g), g.articles[0]) for g in groups]
 
-            # Ask LLM to pick the most representative/impactful article
-            lines = []
-            for i, a in enumerate(group.articles):
-                summary = (a.summary or "")[:200]
-                lines.append(f"[{i}] {a.title}\n    {summary}")
+    def _representative_prompt(self, group: Group) -> str:
+        lines = []
+        for i, a in enumerate(group.articles):
+            summary = (a.summary or "")[:200]
+            lines.append(f"[{i}] {a.title}\n    {summary}")
 
-            items = "\n".join(lines)
+        items = "\n".join(lines)
 
-            prompt = f"""From these {len(group.articles)} related research papers, select the ONE most important and representative paper.
+        return f"""From these {len(group.articles)} related research papers, select the ONE most important and representative paper.
 
 Papers:
 {items}
 
-Respond with ONLY the single index number (e.g., 3). No explanation."""
+Respond with ONLY a JSON object holding the single index (e.g., {{"pick": 3}}). No explanation."""
 
-            response = self.llm.generate(prompt)
+    def _parse_representative(self, group: Group, response: str) -> Article:
+        selected = extract_json(response)
+        idx = selected.get("pick") if isinstance(selected, dict) else selected
+        if isinstance(idx, int) and 0 <= idx < len(group.articles):
+            return group.articles[idx]
+        print(f"ResearchClusterer.select_representatives parse error: no pick in {response[:80]!r}")
 
-            try:
-                match = re.search(r"\d+", response)
-                if match:
-                    idx = int(match.group())
-                    if idx < len(group.articles):
-                        representatives.append(group.articles[idx])
-                        continue
-            except Exception as e:
-                print(f"ResearchClusterer.select_representatives parse error: {e}")
+        # Fallback: pick first article
+        return group.articles[0]
 
-            # Fallback: pick first article
-            representatives.append(group.articles[0])
+    def _generate_all(self, prompts: List[str], json_schema: Optional[dict] = None) -> List[str]:
+        """One LLM response per prompt, in order.
 
-        return representatives
+        Runs on research's shared LLM executor, so these calls count against
+        the same research.LLM_CONCURRENCY cap as the rankers.
+        """
+        return list(_llm_executor().map(
+            lambda prompt: self.llm.generate(prompt, json_schema=json_schema), prompts
+        ))
 
     def process(self, articles: List[Article], max_papers: int = 10) -> List[Article]:
         """Full pipeline: embed → cluster → rank → select representatives.
@@ -189,19 +241,31 @@ Respond with ONLY the single index number (e.g., 3). No explanation."""
         Returns:
             List of representative articles, one per top cluster.
         """
+        # Batches are merged from several feeds; embed and rank each paper once
+        articles = unique_articles(articles)
         if not articles:
             return []
 
         if len(articles) <= max_papers:
             return articles
 
-        print(f"ResearchClusterer: embedding {len(articles)} papers...")
-        groups = self.embed_and_cluster(articles)
-        print(f"ResearchClusterer: found {len(groups)} clusters")
+        if len(articles) <= max_papers * 2:
+            # Too few papers for clusters to matter: rank them individually
+            # instead of paying for embeddings and an O(N²) distance matrix
+            groups = [Group(text=a.title, articles=[a]) for a in articles]
+            print(f"ResearchClusterer: {len(articles)} papers, skipping clustering")
+        else:
+            print(f"ResearchClusterer: embedding {len(articles)} papers...")
+            groups = self.embed_and_cluster(articles)
+            print(f"ResearchClusterer: found {len(groups)} clusters")
 
         groups = self.rank_clusters(groups, top_k=max_papers)
         print(f"ResearchClusterer: ranked to top {len(groups)} clusters")
 
+        if all(len(g.articles) == 1 for g in groups):
+            # Every cluster is a single paper; there is nothing to choose
+            return [g.articles[0] for g in groups][:max_papers]
+
         representatives = self.select_representatives(groups)
         print(f"ResearchClusterer: selected {len(representatives)} representative papers")
 
@@ -1,152 +1,240 @@
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+
+# Forecast-text patterns, compiled once
+_NUMBER_RE = re.compile(r'\d+\.?\d*')
+_KP_FALLBACK_RE = re.compile(r'Kp\s*(\d+\.?\d*)')
+_FLUX_RE = re.compile(r'10\.7\s*cm\s*Radio\s*Flux[:\s]*(\d+)', re.IGNORECASE)
+_GEOMAG_RE = re.compile(r'(\w{3}\s+\d{2})\s+(\w+(?:\s+to\s+\w+)?)', re.MULTILINE)
+
+# The 3-day forecast's Kp table has eight 3-hour rows; stop scanning well past it
+MAX_KP_VALUES = 24
+
+# Kp severity tables indexed by _kp_bucket(kp): 0-2 quiet, 3-4 unsettled,
+# 5-6 active, 7-8 storm, 9 severe
+_KP_COLORS = (
+    "#22c55e", "#22c55e", "#22c55e",  # Green - quiet
+    "#eab308", "#eab308",             # Yellow - unsettled
+    "#f97316", "#f97316",             # Orange - active
+    "#ef4444", "#ef4444",             # Red - storm
+    "#7c2d12",                        # Dark red - severe
+)
+_KP_LEVELS = (
+    "Quiet", "Quiet", "Quiet",
+    "Unsettled", "Unsettled",
+    "Active", "Active",
+    "Storm", "Storm",
+    "Severe Storm",
+)
+
+# Activity keywords to emoji, checked in order (first match wins)
+_ACTIVITY_EMOJI = (
+    (('quiet', 'inactive'), '🟢'),
+    (('unsettled',), '🟡'),
+    (('active',), '🟠'),
+    (('minor', 'storm'), '🔴'),
+    (('moderate', 'strong', 'severe'), '🔴🔴'),
+)
+
+# X-ray flare class letter to emoji; weaker classes (A, B) are green
+_XRAY_EMOJI = {'X': '🔴', 'M': '🟠', 'C': '🟡'}
+
+# NOAA endpoints
+FORECAST_URL = "https://services.swpc.noaa.gov/text/3-day-forecast.txt"
+XRAY_URL = "https://services.swpc.noaa.gov/json/goes/primary/xray-flares-latest.json"
+FLUX_URL = "https://services.swpc.noaa.gov/products/summary/10cm-flux.json"
+WIND_URL = "https://services.swpc.noaa.gov/products/summary/solar-wind-mag-field.json"
+
+# Seconds a fetched response stays fresh, matched to how often NOAA updates it
+NOAA_CACHE_TTLS = {
+    FORECAST_URL: 900,
+    XRAY_URL: 60,
+    FLUX_URL: 3600,
+    WIND_URL: 300,
+}
+DEFAULT_CACHE_TTL = 300
+
+# url -> (fetched_at, parsed payload), shared across instances since callers
+# create a fresh SpaceWeather per request
+_response_cache = {}
+
+
+def _kp_bucket(kp):
+    """Table index for a Kp value; fractional values round up (2.33 is past 2)"""
+    return min(max(math.ceil(kp), 0), 9)
+
+
+@lru_cache(maxsize=16)
+def _render_kp_chart(kp_values, width, height):
+    """SVG bar chart for a tuple of Kp values; identical inputs reuse the last render"""
+    if not kp_values:
+        return ""
+
+    bar_width = width / len(kp_values)
+    # Geometry shared by every bar, worked out once so the loop only formats
+    rect_width = bar_width - 2
+    label_y = height + 12
+    xs = [i * bar_width for i in range(len(kp_values))]
+    label_xs = [x + bar_width / 2 for x in xs]
+    parts = [f'<svg width="{width}" height="{height + 15}" style="display:inline-block;">']
+
+    for x, label_x, kp in zip(xs, label_xs, kp_values):
+        bar_height = (kp / 9) * height  # Kp scale 0-9
+        color = _KP_COLORS[_kp_bucket(int(kp))]
+        # One fragment per bar: the bar and its value label
+        parts.append(
+            f'<rect x="{x}" y="{height-bar_height}" width="{rect_width}" height="{bar_height}" fill="{color}"/>'
+            f'<text x="{label_x}" y="{label_y}" text-anchor="middle" font-size="10">{kp:.1f}</text>'
+        )
+
+    parts.append('<text x="0" y="-5" font-size="10" fill="#666">Kp Index</text></svg>')
+    return "".join(parts)
 
 class SpaceWeather(object):
     def __init__(self):
-        pass
+        # All NOAA endpoints share one host; keep-alive lets the concurrent
+        # fetches in format_forecast reuse connections instead of new TLS handshakes
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+    def _get_cached(self, url, parse):
+        """GET url and parse the response, reusing a result fresher than its TTL.
+
+        Returns None for a non-200 response (not cached); request errors propagate.
+        """
+        cached = _response_cache.get(url)
+        if cached and time.monotonic() - cached[0] < NOAA_CACHE_TTLS.get(url, DEFAULT_CACHE_TTL):
+            return cached[1]
+        resp = self.session.get(url, timeout=10)
+        if resp.status_code != 200:
+            return None
+        payload = parse(resp)
+        _response_cache[url] = (time.monotonic(), payload)
+        return payload
     
     def _parse_kp_index(self, text):
         """Extract Kp index values from forecast text"""
-        # Look for decimal Kp values in the breakdown table
-        kp_matches = re.findall(r'(\d+\.?\d*)\s+(?=\d+\.?\d*\s+\d+\.?\d*\s*$)', text, re.MULTILINE)
+        # Look for decimal Kp values in the breakdown table: rows ending in
+        # three numbers (one per day); the first day's column is kept
+        kp_matches = []
+        for line in text.splitlines():
+            tokens = line.split()
+            if len(tokens) >= 3 and all(_NUMBER_RE.fullmatch(t) for t in tokens[-3:]):
+                kp_matches.append(tokens[-3])
+                if len(kp_matches) >= MAX_KP_VALUES:
+                    break
         if not kp_matches:
             # Fallback to looking for "Kp X" pattern
-            kp_matches = re.findall(r'Kp\s*(\d+\.?\d*)', text)
-        return [float(k) for k in kp_matches] if kp_matches else []
+            kp_matches = [m.group(1) for m in islice(_KP_FALLBACK_RE.finditer(text), MAX_KP_VALUES)]
+        return [float(k) for k in kp_matches]
     
     def _parse_solar_flux(self, text):
         """Extract solar flux values"""
-        flux_matches = re.findall(r'10\.7\s*cm\s*Radio\s*Flux[:\s]*(\d+)', text, re.IGNORECASE)
+        flux_matches = _FLUX_RE.findall(text)
         return [int(f) for f in flux_matches] if flux_matches else []
     
     def _create_kp_chart(self, kp_values, width=200, height=40):
         """Create SVG chart for Kp index"""
-        if not kp_values:
-            return ""
-        
-        bar_width = width / len(kp_values)
-        bars = []
-        
-        for i, kp in enumerate(kp_values):
-            x = i * bar_width
-            bar_height = (kp / 9) * height  # Kp scale 0-9
-            color = self._get_kp_color(int(kp))
-            bars.append(f'<rect x="{x}" y="{height-bar_height}" width="{bar_width-2}" height="{bar_height}" fill="{color}"/>')
-            bars.append(f'<text x="{x + bar_width/2}" y="{height + 12}" text-anchor="middle" font-size="10">{kp:.1f}</text>')
-        
-        return f"""<svg width="{width}" height="{height + 15}" style="display:inline-block;">
-{chr(10).join(bars)}
-<text x="0" y="-5" font-size="10" fill="#666">Kp Index</text>
-</svg>"""
+        return _render_kp_chart(tuple(kp_values), width, height)
     
     def _get_kp_color(self, kp):
         """Get color based on Kp index severity"""
-        if kp <= 2:
-            return "#22c55e"  # Green - quiet
-        elif kp <= 4:
-            return "#eab308"  # Yellow - unsettled
-        elif kp <= 6:
-            return "#f97316"  # Orange - active
-        elif kp <= 8:
-            return "#ef4444"  # Red - storm
-        else:
-            return "#7c2d12"  # Dark red - severe
+        return _KP_COLORS[_kp_bucket(kp)]
     
     def _get_activity_level(self, kp):
         """Get activity description from Kp index"""
-        if kp <= 2:
-            return "Quiet"
-        elif kp <= 4:
-            return "Unsettled"
-        elif kp <= 6:
-            return "Active"
-        elif kp <= 8:
-            return "Storm"
-        else:
-            return "Severe Storm"
+        return _KP_LEVELS[_kp_bucket(kp)]
     
     def pull_data(self):
         """Fetch raw space weather forecast text"""
-        txt_url = "https://services.swpc.noaa.gov/text/3-day-forecast.txt"
         try:
-            txt_resp = requests.get(txt_url, timeout=10)
-            if txt_resp.status_code != 200:
+            text = self._get_cached(FORECAST_URL, lambda resp: resp.text)
+            if text is None:
                 return "error fetching space weather"
-            return txt_resp.text
+            return text
         except Exception as e:
             return f"error fetching space weather: {e}"
 
     def _parse_geomag_activity(self, text):
         """Extract geomagnetic activity levels from forecast"""
         # Look for lines like "Geomagnetic Activity Summary:" followed by date and activity level
-        activity_pattern = re.compile(r'(\w{3}\s+\d{2})\s+(\w+(?:\s+to\s+\w+)?)', re.MULTILINE)
-        matches = activity_pattern.findall(text)
+        matches = _GEOMAG_RE.findall(text)
         return matches[:3]  # Return first 3 days
 
     def _get_activity_emoji(self, activity):
         """Map activity level to emoji"""
         activity = activity.lower()
-        if 'quiet' in activity or 'inactive' in activity:
-            return '🟢'
-        elif 'unsettled' in activity:
-            return '🟡'
-        elif 'active' in activity:
-            return '🟠'
-        elif 'minor' in activity or 'storm' in activity:
-            return '🔴'
-        elif 'moderate' in activity or 'strong' in activity or 'severe' in activity:
-            return '🔴🔴'
-        else:
-            return '⚪'
+        for keywords, emoji in _ACTIVITY_EMOJI:
+            if any(keyword in activity for keyword in keywords):
+                return emoji
+        return '⚪'
 
-    def _fetch_current_data(self):
-        """Fetch current space weather data from NOAA APIs"""
+    def _fetch_xray(self):
+        """X-ray flux (current and recent max)"""
         data = {}
-
         try:
-            # X-ray flux (current and recent max)
-            xray_resp = requests.get('https://services.swpc.noaa.gov/json/goes/primary/xray-flares-latest.json', timeout=10)
-            if xray_resp.status_code == 200:
-                xray_data = xray_resp.json()
-                if xray_data:
-                    latest = xray_data[0]
-                    data['xray_current'] = latest.get('current_class', 'N/A')
-                    data['xray_max_24h'] = latest.get('max_class', 'N/A')
-                    data['xray_max_time'] = latest.get('max_time', 'N/A')
+            xray_data = self._get_cached(XRAY_URL, lambda resp: resp.json())
+            if xray_data:
+                latest = xray_data[0]
+                data['xray_current'] = latest.get('current_class', 'N/A')
+                data['xray_max_24h'] = latest.get('max_class', 'N/A')
+                data['xray_max_time'] = latest.get('max_time', 'N/A')
         except:
             pass
+        return data
 
+    def _fetch_solar_flux(self):
+        """Solar flux (10.7cm)"""
+        data = {}
         try:
-            # Solar flux (10.7cm)
-            flux_resp = requests.get('https://services.swpc.noaa.gov/products/summary/10cm-flux.json', timeout=10)
-            if flux_resp.status_code == 200:
-                flux_data = flux_resp.json()
+            flux_data = self._get_cached(FLUX_URL, lambda resp: resp.json())
+            if flux_data is not None:
                 data['solar_flux'] = flux_data.get('Flux', 'N/A')
         except:
             pass
+        return data
 
+    def _fetch_solar_wind(self):
+        """Solar wind magnetic field"""
+        data = {}
         try:
-            # Solar wind
-            wind_resp = requests.get('https://services.swpc.noaa.gov/products/summary/solar-wind-mag-field.json', timeout=10)
-            if wind_resp.status_code == 200:
-                wind_data = wind_resp.json()
+            wind_data = self._get_cached(WIND_URL, lambda resp: resp.json())
+            if wind_data is not None:
                 data['solar_wind_bt'] = wind_data.get('Bt', 'N/A')
                 data['solar_wind_bz'] = wind_data.get('Bz', 'N/A')
         except:
             pass
+        return data
 
+    def _fetch_current_data(self):
+        """Fetch current space weather data from NOAA APIs"""
+        # Independent endpoints: fetch side by side so the total wait is the slowest one
+        fetchers = (self._fetch_xray, self._fetch_solar_flux, self._fetch_solar_wind)
+        data = {}
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            for part in executor.map(lambda fetch: fetch(), fetchers):
+                data.update(part)
         return data
 
     def format_forecast(self):
         """Parse and format space weather forecast without LLM"""
-        # Get 3-day forecast text (includes peak Kp)
-        forecast_text = self.pull_data()
-        if forecast_text.startswith("error"):
-            return f"❌ {forecast_text}"
+        # Current data from the JSON APIs loads while the forecast text does
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            current_future = executor.submit(self._fetch_current_data)
 
-        # Get current data from JSON APIs
-        current_data = self._fetch_current_data()
+            # Get 3-day forecast text (includes peak Kp)
+            forecast_text = self.pull_data()
+            if forecast_text.startswith("error"):
+                return f"❌ {forecast_text}"
+
+            current_data = current_future.result()
 
         # Parse Kp index from forecast
         kp_values = self._parse_kp_index(forecast_text)
@@ -155,11 +243,8 @@ class SpaceWeather(object):
         current_kp = kp_values[0] if kp_values else 0
         peak_kp = max(kp_values) if kp_values else 0
 
-        # Get activity levels
+        # Get activity level and emoji for current activity
         current_activity = self._get_activity_level(current_kp)
-        peak_activity = self._get_activity_level(peak_kp)
-
-        # Get emoji for current activity
         kp_emoji = self._get_activity_emoji(current_activity)
 
         # Format X-ray data
@@ -168,14 +253,7 @@ class SpaceWeather(object):
 
         # Determine X-ray emoji (simplified)
         if xray_peak != 'N/A' and isinstance(xray_peak, str):
-            if xray_peak.startswith('X'):
-                xray_emoji = '🔴'
-            elif xray_peak.startswith('M'):
-                xray_emoji = '🟠'
-            elif xray_peak.startswith('C'):
-                xray_emoji = '🟡'
-            else:
-                xray_emoji = '🟢'
+            xray_emoji = _XRAY_EMOJI.get(xray_peak[:1], '🟢')
         else:
             xray_emoji = '⚪'
 
@@ -191,6 +269,7 @@ class SpaceWeather(object):
 
         # Kp Index
         if kp_values:
+            peak_activity = self._get_activity_level(peak_kp)
             lines.append(f"- {kp_emoji} **Kp Index**: {current_kp:.1f} (24h peak: {peak_kp:.1f} - {peak_activity})")
         else:
             lines.append(f"- ⚪ **Kp Index**: N/A")
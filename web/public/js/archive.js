@@ -0,0 +1,70 @@
+/**
+ * Briefing archive — appends older entries from /briefings/index.json.
+ * publish_site.py pre-renders the newest entries; the rest are added in
+ * chunks as the end of the list scrolls into view.
+ */
+
+const ARCHIVE_CHUNK = 100;
+
+// Matches _model_pill() in publish_site.py
+const MODEL_PILL_STYLE = 'display:inline-block;background-color:#7f8c8d;color:#fff;' +
+  'font-size:10px;font-weight:600;padding:1px 7px;border-radius:9px;' +
+  'vertical-align:middle;margin-left:6px;';
+
+function archiveItem(b) {
+  const li = document.createElement('li');
+  const a = document.createElement('a');
+  a.href = '/briefings/' + b.u;
+  const strong = document.createElement('strong');
+  strong.textContent = b.d;
+  const small = document.createElement('small');
+  small.textContent = `${b.t} · ${b.s} sections`;
+  if (b.m) {
+    const pill = document.createElement('span');
+    pill.style.cssText = MODEL_PILL_STYLE;
+    pill.textContent = b.m;
+    small.appendChild(pill);
+  }
+  a.append(strong, small);
+  li.appendChild(a);
+  return li;
+}
+
+document.addEventListener('DOMContentLoaded', async () => {
+  const list = document.getElementById('briefing-list');
+  if (!list || !list.dataset.index) return;
+
+  let entries;
+  try {
+    const resp = await fetch(list.dataset.index);
+    if (!resp.ok) throw new Error(`HTTP ${resp.status}`);
+    entries = await resp.json();
+  } catch (err) {
+    console.error('Archive index fetch failed:', err);
+    return;
+  }
+
+  let next = list.children.length;
+  const appendChunk = () => {
+    const frag = document.createDocumentFragment();
+    entries.slice(next, next + ARCHIVE_CHUNK).forEach(b => frag.appendChild(archiveItem(b)));
+    list.appendChild(frag);
+    next += ARCHIVE_CHUNK;
+    return next < entries.length;
+  };
+
+  if (!('IntersectionObserver' in window)) {
+    while (appendChunk());
+    return;
+  }
+
+  const sentinel = document.createElement('div');
+  list.after(sentinel);
+  const observer = new IntersectionObserver(items => {
+    if (items.some(i => i.isIntersecting) && !appendChunk()) {
+      observer.disconnect();
+      sentinel.remove();
+    }
+  });
+  observer.observe(sentinel);
+});